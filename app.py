@@ -1,58 +1,102 @@
 # app.py
+import inspect
+import os
+import sys
+
+# src/ 내부 모듈은 패키지 최상위 이름(resume, generation ...)으로 서로를 임포트함
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
 import gradio as gr
 from src.graph.agent_v2 import (
-    preProcessing_Interview,
+    apreProcessing_Interview,
     update_current_answer,
-    graph
+    get_graph,
+    warmup,
 )
 
+from src.session.session_store import get_store
+
 # 세션 상태 초기화
 def init_state():
     return {
         "state": None,
         "started": False,
         "ended": False,
-        "history": []
+        "history": [],
+        "resume_path": "",
     }
 
-# 파일 업로드 & 준비
-def upload_resume(file_obj, session_state):
+# 대화 기록은 [화자, 내용] 쌍으로 보관하고, Chatbot에는 messages 형식으로 변환해 전달
+def to_chat_messages(history):
+    if isinstance(history, str):
+        history = [[history]]
+    messages = []
+    for item in history:
+        if len(item) == 1:
+            messages.append({"role": "assistant", "content": item[0]})
+        elif item[0] == "🙋 지원자":
+            messages.append({"role": "user", "content": item[1]})
+        else:
+            messages.append({"role": "assistant", "content": f"{item[0]}\n\n{item[1]}"})
+    return messages
+
+# gr.State에는 세션 id만 두고, 세션 데이터는 session_store가 관리(유휴 세션은 디스크로 내림)
+# 저장소의 SQLite/압축 작업은 스레드에서 실행(aget/aput 등)해 이벤트 루프를 막지 않음
+async def load_session(session_id):
+    data = await get_store().aget(session_id)
+    if data is None:
+        return init_state(), bool(session_id)
+    return data, False
+
+# 파일 업로드 & 준비 (async: LLM 대기 동안 이벤트 루프가 다른 세션을 처리)
+async def upload_resume(file_obj, session_id):
     if file_obj is None:
-        return session_state, "❗ 이력서를 업로드해주세요."
+        return session_id, to_chat_messages("❗ 이력서를 업로드해주세요.")
 
     file_path = file_obj.name
-    state = preProcessing_Interview(file_path)
+    state = await apreProcessing_Interview(file_path)
 
+    session_state = init_state()
     session_state["state"] = state
     session_state["started"] = True
+    session_state["resume_path"] = file_path
     session_state["history"] = [["🤖 AI 면접관", state["current_question"]]]
 
-    return session_state, session_state["history"]
+    store = get_store()
+    if session_id:
+        await store.adelete(session_id)
+    session_id = await store.acreate(session_state)
+
+    return session_id, to_chat_messages(session_state["history"])
 
 # 답변 처리
-def chat(user_text, session_state):
+async def chat(user_text, session_id):
+    session_state, expired = await load_session(session_id)
+    if expired:
+        return None, to_chat_messages("❗ 세션이 만료되었습니다. 이력서를 다시 업로드 해주세요.")
     if not session_state["started"]:
-        return session_state, [["❗ 먼저 이력서를 업로드 해주세요."]]
+        return session_id, to_chat_messages("❗ 먼저 이력서를 업로드 해주세요.")
+
+    store = get_store()
 
     if session_state["ended"]:
         # 재시작 여부
         if user_text.strip().lower() in ["예", "yes", "y"]:
-            old = session_state["state"]
-            new_state = preProcessing_Interview(old.get("resume_text_path", ""))
+            new_state = await apreProcessing_Interview(session_state["resume_path"])
             session_state["state"] = new_state
             session_state["ended"] = False
             session_state["history"] = [["🤖 AI 면접관", new_state["current_question"]]]
-            return session_state, session_state["history"]
         else:
             session_state["history"].append(["🤖 AI 면접관", "면접을 종료합니다."])
-            return session_state, session_state["history"]
+        await store.aput(session_id, session_state)
+        return session_id, to_chat_messages(session_state["history"])
 
     # 일반 답변 처리
     session_state["history"].append(["🙋 지원자", user_text])
     session_state["state"] = update_current_answer(session_state["state"], user_text)
 
     # LangGraph 실행
-    session_state["state"] = graph.invoke(session_state["state"])
+    session_state["state"] = await get_graph(async_mode=True).ainvoke(session_state["state"])
 
     # 종료 여부
     if session_state["state"]["next_step"] == "end":
@@ -61,30 +105,52 @@ def chat(user_text, session_state):
         report = session_state["state"].get("summary_report", "")
         session_state["history"].append(["📋 면접 보고서", report])
         session_state["history"].append(["🤖 AI 면접관", "인터뷰가 종료되었습니다. 다시 진행할까요? (예/아니오)"])
+    else:
+        # 다음 질문
+        next_q = session_state["state"]["current_question"]
+        session_state["history"].append(["🤖 AI 면접관", next_q])
 
-        return session_state, session_state["history"]
+    await store.aput(session_id, session_state)
+    return session_id, to_chat_messages(session_state["history"])
 
-    # 다음 질문
-    next_q = session_state["state"]["current_question"]
-    session_state["history"].append(["🤖 AI 면접관", next_q])
-
-    return session_state, session_state["history"]
+# 세션 저장소 지표 (상주 세션 수/바이트, 디스크로 내린 세션 수/바이트 등)
+def session_metrics():
+    return get_store().metrics()
 
 # UI 구성
-with gr.Blocks() as demo:
-    session = gr.State(init_state())
+def create_app(warm: bool = True) -> gr.Blocks:
+    """
+    Gradio 앱을 생성한다(실행은 호출 측에서 launch).
+    warm=True이면 클라이언트/그래프 초기화를 백그라운드에서 미리 수행한다.
+    """
+    if warm:
+        warmup(background=True)
+
+    with gr.Blocks() as demo:
+        session = gr.State(None)  # 세션 id
+
+        gr.Markdown("# 🤖 AI Interview Agent\n이력서를 업로드하고 면접을 시작하세요!")
+
+        with gr.Row():
+            file_input = gr.File(label="📄 이력서 업로드 (PDF 또는 DOCX)")
+            start_btn = gr.Button("인터뷰 시작")
+
+        # Gradio 5 이하는 messages 형식을 명시해야 함(6부터는 messages만 지원)
+        chat_kwargs = {"type": "messages"} if "type" in inspect.signature(gr.Chatbot.__init__).parameters else {}
+        chatbox = gr.Chatbot(height=500, **chat_kwargs)
+        textbox = gr.Textbox(placeholder="답변을 입력하고 Enter를 누르세요.", show_label=False)
 
-    gr.Markdown("# 🤖 AI Interview Agent\n이력서를 업로드하고 면접을 시작하세요!")
+        # 핸들러가 async이므로 동시 실행 제한을 두지 않아도 스레드를 점유하지 않음
+        start_btn.click(upload_resume, inputs=[file_input, session], outputs=[session, chatbox], concurrency_limit=None)
+        textbox.submit(chat, inputs=[textbox, session], outputs=[session, chatbox], concurrency_limit=None)
+        textbox.submit(lambda: "", None, textbox)
 
-    with gr.Row():
-        file_input = gr.File(label="📄 이력서 업로드 (PDF 또는 DOCX)")
-        start_btn = gr.Button("인터뷰 시작")
+        # 운영용 API 엔드포인트(화면에는 표시하지 않음): gradio_client로 /session_metrics 호출
+        metrics_btn = gr.Button(visible=False)
+        metrics_btn.click(session_metrics, None, gr.JSON(visible=False), api_name="session_metrics")
 
-    chatbox = gr.Chatbot(height=500)
-    textbox = gr.Textbox(placeholder="답변을 입력하고 Enter를 누르세요.", show_label=False)
+    return demo
 
-    start_btn.click(upload_resume, inputs=[file_input, session], outputs=[session, chatbox])
-    textbox.submit(chat, inputs=[textbox, session], outputs=[session, chatbox])
-    textbox.submit(lambda: "", None, textbox)
 
-demo.launch()
+if __name__ == "__main__":
+    create_app().launch()
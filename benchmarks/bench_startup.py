@@ -0,0 +1,86 @@
+# benchmarks/bench_startup.py
+"""
+콜드 스타트 벤치마크.
+
+매 측정마다 새 파이썬 프로세스를 띄워(임포트 캐시 없음) 아래 단계를 잰다.
+  - import   : `src.graph.agent_v2` 임포트
+  - graph    : 첫 get_graph() 컴파일
+  - warmup   : warmup(background=False) (모듈 로드 + 클라이언트 생성 + 그래프 컴파일, 네트워크 호출 없음)
+  - app      : `app` 임포트 + create_app(warm=False) (gradio 설치 시)
+
+사용법:
+    python benchmarks/bench_startup.py --runs 5
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_PRELUDE = f"""
+import json, sys, time
+sys.path.insert(0, {os.path.join(ROOT, "src")!r})
+sys.path.insert(0, {ROOT!r})
+"""
+
+STAGES = {
+    "import": """
+t = time.perf_counter()
+import src.graph.agent_v2
+print(json.dumps({"sec": time.perf_counter() - t}))
+""",
+    "graph": """
+import src.graph.agent_v2 as agent
+t = time.perf_counter()
+agent.get_graph()
+print(json.dumps({"sec": time.perf_counter() - t}))
+""",
+    "warmup": """
+import src.graph.agent_v2 as agent
+t = time.perf_counter()
+agent.warmup(background=False)
+print(json.dumps({"sec": time.perf_counter() - t}))
+""",
+    "app": """
+t = time.perf_counter()
+import app
+app.create_app(warm=False)
+print(json.dumps({"sec": time.perf_counter() - t}))
+""",
+}
+
+
+def run_stage(code: str) -> float:
+    env = {**os.environ}
+    # 클라이언트 생성에는 키 값만 필요(요청은 보내지 않음)
+    env.setdefault("OPENAI_API_KEY", "sk-bench")
+    out = subprocess.run(
+        [sys.executable, "-c", _PRELUDE + code],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])["sec"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI Interview Agent 콜드 스타트 벤치마크")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--stages", nargs="*", default=list(STAGES))
+    args = parser.parse_args()
+
+    print(f"{'stage':<8} {'median(ms)':>11} {'min(ms)':>9} {'max(ms)':>9}")
+    for name in args.stages:
+        try:
+            samples = [run_stage(STAGES[name]) * 1000 for _ in range(args.runs)]
+        except subprocess.CalledProcessError as e:
+            last = (e.stderr or "").strip().splitlines()[-1:] or [""]
+            print(f"{name:<8} {'skipped':>11}  ({last[0]})")
+            continue
+        print(f"{name:<8} {statistics.median(samples):>11.1f} {min(samples):>9.1f} {max(samples):>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
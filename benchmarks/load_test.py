@@ -0,0 +1,317 @@
+# benchmarks/load_test.py
+"""
+동시 지원자 부하 테스트.
+
+스크립트된 지원자들을 포아송 도착(평균 --rate 명/초)으로 투입해 이력서 업로드 → 답변 반복 → 종료까지 진행한다.
+  - inprocess : app.py의 upload_resume / chat 핸들러를 같은 이벤트 루프에서 직접 호출
+  - client    : 실행 중인 Gradio 서버(--url)에 gradio_client로 요청 (지원자마다 별도 세션)
+
+기본으로 LLM/임베딩은 모의 모델(INTERVIEW_SIMULATE_LLM=1)을 사용하고, 노드별 지연 분포는
+src/llm/simulated.py의 LATENCY_PROFILE을 따른다(--latency-scale로 배율 조정).
+client 모드에서는 서버를 같은 환경 변수로 띄워야 한다:
+    INTERVIEW_SIMULATE_LLM=1 python app.py
+
+보고 항목:
+  - 처리량 (완료 턴/초, 완료 인터뷰/분)
+  - 대기 지연 : inprocess = 예정 시각 대비 핸들러 시작 지연(이벤트 루프 지연),
+                client    = 제출부터 서버가 처리를 시작할 때까지(Gradio 큐 대기)
+  - 업로드/턴 지연 백분위수 (p50/p90/p95/p99)
+  - 메모리 증가 (RSS 시작/최대/종료), inprocess는 세션 저장소 지표와 남은 백그라운드 항목 수
+
+사용법:
+    python benchmarks/load_test.py --candidates 50 --rate 2 --turns 5 --latency-scale 0.2
+    python benchmarks/load_test.py --mode client --url http://127.0.0.1:7860 --candidates 20 --rate 1
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 답변 스크립트: 짧은 답변(재평가 유도) / 수치 없는 긴 답변 / 근거가 충분한 답변을 섞음
+ANSWERS = [
+    "잘 모르겠습니다.",
+    "팀 프로젝트에서 데이터 전처리와 모델링을 맡았고, 팀원들과 매주 회의를 하며 진행 상황을 공유했습니다. "
+    "문제가 생기면 함께 원인을 찾아 해결했고 그 과정에서 협업의 중요성을 배웠습니다.",
+    "고객 이탈 예측 프로젝트에서 3개월 동안 XGBoost 모델을 개발해 정확도를 12% 개선했습니다. "
+    "피처 엔지니어링으로 결측치를 처리하고 교차 검증으로 과적합을 확인했으며, 결과를 대시보드로 공유했습니다.",
+    "그 부분은 경험이 부족하지만 관련 강의를 들으며 공부하고 있습니다.",
+]
+END_MARKER = "다시 진행할까요"
+
+RESUME_LINES = [
+    "■ 지원 분야", "데이터 분석가",
+    "■ 프로젝트", "- 고객 이탈 예측 모델 개발: Python, Pandas, XGBoost 활용, 정확도 12% 향상",
+    "- 추천 시스템 구축 (PyTorch), 6개월",
+    "■ 기술 스택", "Python, SQL, Docker, AWS, Tableau",
+    "■ 자격증", "SQLD, ADsP, 정보처리기사",
+]
+
+
+def make_resume(directory: str) -> str:
+    from docx import Document
+
+    path = os.path.join(directory, "load_test_resume.docx")
+    doc = Document()
+    for line in RESUME_LINES:
+        doc.add_paragraph(line)
+    doc.save(path)
+    return path
+
+
+def rss_mb(pid: Optional[int] = None) -> float:
+    """현재 RSS(MB). /proc이 없으면 최대 RSS로 대체."""
+    try:
+        with open(f"/proc/{pid or 'self'}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    if not samples:
+        return {}
+    import numpy as np
+
+    arr = np.asarray(samples) * 1000
+    return {
+        "n": len(samples),
+        **{f"p{q}": round(float(np.percentile(arr, q)), 1) for q in (50, 90, 95, 99)},
+        "max": round(float(arr.max()), 1),
+    }
+
+
+# ============================================================
+# 호출 방식
+# ============================================================
+class InProcessTarget:
+    """app.py 핸들러를 직접 호출한다. 세션 id는 gr.State 대신 지원자 객체가 보관."""
+
+    def __init__(self):
+        sys.path.insert(0, ROOT)
+        import app
+
+        self.app = app
+
+    def new_session(self):
+        return {"session_id": None}
+
+    async def upload(self, session, resume_path: str):
+        t = time.perf_counter()
+        session["session_id"], history = await self.app.upload_resume(
+            SimpleNamespace(name=resume_path), session["session_id"]
+        )
+        return 0.0, time.perf_counter() - t, history
+
+    async def chat(self, session, text: str):
+        t = time.perf_counter()
+        session["session_id"], history = await self.app.chat(text, session["session_id"])
+        return 0.0, time.perf_counter() - t, history
+
+    def extra_metrics(self) -> Dict[str, Any]:
+        from generation import running_summary
+        from strategy import progressive
+
+        return {
+            "session_store": self.app.get_store().metrics(),
+            # 인터뷰가 모두 끝났다면 0이어야 함(남아 있으면 레지스트리 누수)
+            "leftover_running_summary": len(running_summary._sessions),
+            "leftover_progressive": len(progressive._pending),
+        }
+
+
+class ClientTarget:
+    """gradio_client로 로컬 서버에 요청한다. 지원자마다 Client(세션)를 하나씩 사용."""
+
+    def __init__(self, url: str, workers: int):
+        from gradio_client import Client, handle_file
+        from gradio_client.utils import Status
+
+        self.Client, self.handle_file, self.Status = Client, handle_file, Status
+        self.url = url
+        # 작업 상태를 폴링하는 스레드(동시 요청 수만큼)
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+
+    def new_session(self):
+        return {"client": self.Client(self.url, verbose=False)}
+
+    def _run(self, client, api_name: str, *args):
+        submitted = time.perf_counter()
+        job = client.submit(*args, api_name=api_name)
+        started = None
+        while not job.done():
+            if started is None and job.status().code in (self.Status.PROCESSING, self.Status.ITERATING):
+                started = time.perf_counter()
+            time.sleep(0.005)
+        history = job.result()
+        finished = time.perf_counter()
+        started = started or finished
+        return started - submitted, finished - submitted, history
+
+    async def upload(self, session, resume_path: str):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.pool, self._run, session["client"], "/upload_resume", self.handle_file(resume_path)
+        )
+
+    async def chat(self, session, text: str):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.pool, self._run, session["client"], "/chat", text)
+
+    def extra_metrics(self) -> Dict[str, Any]:
+        try:
+            return {"session_store": self.Client(self.url, verbose=False).predict(api_name="/session_metrics")}
+        except Exception as e:
+            return {"session_store": f"조회 실패: {e}"}
+
+
+def _ended(history) -> bool:
+    last = history[-1] if isinstance(history, list) and history else None
+    return END_MARKER in json.dumps(last, ensure_ascii=False)
+
+
+# ============================================================
+# 지원자 시나리오
+# ============================================================
+async def candidate(idx: int, arrival: float, t0: float, target, args, resume_path: str, rec: Dict[str, list]):
+    loop = asyncio.get_running_loop()
+    rng = random.Random(idx)
+
+    async def at(when: float):
+        """when(실행 시작 기준 초)까지 기다리고, 이벤트 루프 지연을 돌려준다."""
+        await asyncio.sleep(max(0.0, when - (loop.time() - t0)))
+        return max(0.0, (loop.time() - t0) - when)
+
+    lag = await at(arrival)
+    session = target.new_session()
+    try:
+        queued, latency, history = await target.upload(session, resume_path)
+        rec["queue"].append(lag + queued)
+        rec["upload"].append(latency)
+
+        for turn in range(args.turns + 2):
+            think = rng.expovariate(1.0 / args.think_time) if args.think_time > 0 else 0.0
+            lag = await at((loop.time() - t0) + think)
+            queued, latency, history = await target.chat(session, ANSWERS[(idx + turn) % len(ANSWERS)])
+            rec["queue"].append(lag + queued)
+            rec["turn"].append(latency)
+            if _ended(history):
+                rec["completed"].append(loop.time() - t0)
+                return
+        rec["errors"].append(f"#{idx}: {args.turns + 2}턴 안에 종료되지 않음")
+    except Exception as e:
+        rec["errors"].append(f"#{idx}: {type(e).__name__}: {e}")
+
+
+async def memory_sampler(samples: List[float], pid: Optional[int], stop: asyncio.Event):
+    while not stop.is_set():
+        samples.append(rss_mb(pid))
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=0.5)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def run(args, target, resume_path: str) -> Dict[str, Any]:
+    rng = random.Random(args.seed)
+    arrivals, t = [], 0.0
+    for _ in range(args.candidates):
+        arrivals.append(t)
+        t += rng.expovariate(args.rate)
+
+    rec: Dict[str, list] = {"queue": [], "upload": [], "turn": [], "completed": [], "errors": []}
+    mem: List[float] = []
+    stop = asyncio.Event()
+    pid = args.server_pid if args.mode == "client" else None
+
+    loop = asyncio.get_running_loop()
+    t0 = loop.time()
+    sampler = asyncio.create_task(memory_sampler(mem, pid, stop))
+    await asyncio.gather(*(
+        candidate(i, arrivals[i], t0, target, args, resume_path, rec) for i in range(args.candidates)
+    ))
+    elapsed = loop.time() - t0
+    stop.set()
+    await sampler
+
+    return {
+        "candidates": args.candidates,
+        "arrival_rate": args.rate,
+        "elapsed_sec": round(elapsed, 2),
+        "completed_interviews": len(rec["completed"]),
+        "throughput": {
+            "turns_per_sec": round(len(rec["turn"]) / elapsed, 2) if elapsed else 0.0,
+            "interviews_per_min": round(len(rec["completed"]) * 60 / elapsed, 2) if elapsed else 0.0,
+        },
+        "queue_delay_ms": percentiles(rec["queue"]),
+        "upload_latency_ms": percentiles(rec["upload"]),
+        "turn_latency_ms": percentiles(rec["turn"]),
+        "memory_mb": {
+            "start": round(mem[0], 1) if mem else None,
+            "peak": round(max(mem), 1) if mem else None,
+            "end": round(rss_mb(pid), 1) if mem else None,
+            "growth": round(rss_mb(pid) - mem[0], 1) if mem else None,
+        },
+        "errors": rec["errors"][:10],
+        "error_count": len(rec["errors"]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI Interview Agent 동시 지원자 부하 테스트")
+    parser.add_argument("--mode", choices=["inprocess", "client"], default="inprocess")
+    parser.add_argument("--url", default="http://127.0.0.1:7860", help="client 모드 서버 주소")
+    parser.add_argument("--server-pid", type=int, default=None, help="client 모드에서 RSS를 잴 서버 PID")
+    parser.add_argument("--candidates", type=int, default=20)
+    parser.add_argument("--rate", type=float, default=1.0, help="평균 도착률(명/초, 포아송)")
+    parser.add_argument("--turns", type=int, default=5, help="인터뷰당 질문 수(INTERVIEW_MAX_TURNS)")
+    parser.add_argument("--think-time", type=float, default=1.0, help="답변 사이 평균 대기(초, 지수분포)")
+    parser.add_argument("--latency-scale", type=float, default=1.0, help="모의 LLM 지연 배율")
+    parser.add_argument("--real-llm", action="store_true", help="inprocess 모드에서 실제 API 사용(비용 발생)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--resume", default=None, help="사용할 이력서 파일(PDF/DOCX). 기본: 임시 DOCX 생성")
+    parser.add_argument("--verbose", action="store_true", help="핸들러 출력(면접 보고서 등)을 숨기지 않음")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="interview-load-")
+    resume_path = args.resume or make_resume(workdir)
+
+    if args.mode == "inprocess":
+        # 핸들러 임포트 전에 설정(세션 저장소/캐시는 임시 디렉터리 사용)
+        if not args.real_llm:
+            os.environ["INTERVIEW_SIMULATE_LLM"] = "1"
+            os.environ.setdefault("OPENAI_API_KEY", "sk-load-test")
+        os.environ["INTERVIEW_SIMULATED_LATENCY_SCALE"] = str(args.latency_scale)
+        os.environ["INTERVIEW_MAX_TURNS"] = str(args.turns)
+        os.environ.setdefault("INTERVIEW_SESSION_PATH", os.path.join(workdir, "sessions.sqlite"))
+        os.environ.setdefault("INTERVIEW_LLM_CACHE_PATH", os.path.join(workdir, "llm_responses.sqlite"))
+        target = InProcessTarget()
+        target.app.warmup(background=False)
+    else:
+        target = ClientTarget(args.url, workers=max(4, args.candidates))
+
+    quiet = contextlib.nullcontext() if args.verbose else contextlib.redirect_stdout(io.StringIO())
+    with quiet:
+        report = asyncio.run(run(args, target, resume_path))
+        report.update(target.extra_metrics())
+
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,16 @@
 # run.py
 import os
-from src.graph.agent_v2 import preProcessing_Interview, update_current_answer, graph
+import sys
+
+# src/ 내부 모듈은 패키지 최상위 이름(resume, generation ...)으로 서로를 임포트함
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from src.graph.agent_v2 import preProcessing_Interview, update_current_answer, get_graph, warmup
 
 def main():
     print("=== AI Interview Agent (CLI 모드) ===")
+    # 파일 경로를 입력하는 동안 클라이언트/그래프를 미리 준비
+    warmup(background=True)
     
     file_path = input("이력서 파일 경로(PDF 또는 DOCX)를 입력하세요: ").strip()
     if not os.path.exists(file_path):
@@ -20,7 +27,7 @@ def main():
         state = update_current_answer(state, user_answer)
 
         # LangGraph 실행
-        state = graph.invoke(state)
+        state = get_graph().invoke(state)
 
         # 종료 판정
         if state.get("next_step") == "end":
@@ -0,0 +1,127 @@
+# src/analytics/query.py
+"""
+평가 기록(analytics/sink.py가 쓴 Parquet) 집계.
+
+필요한 컬럼만 읽고(strategy 등은 사전 인코딩 그대로), 그룹별 집계는 NumPy bincount로 한 번에 계산한다.
+
+사용법:
+    python src/analytics/query.py --dir ./analytics
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+if __package__ in (None, ""):
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.sink import ANALYTICS_DIR_ENV, SCORE_KEYS, SCORE_LABELS, analytics_dir
+
+
+# ============================================================
+# load
+# ============================================================
+def load(columns: List[str], directory: Optional[str] = None, filter=None):
+    """
+    기록 디렉터리에서 지정한 컬럼만 읽어 pyarrow.Table로 반환한다.
+    filter에는 pyarrow.dataset 식을 넘길 수 있다(예: ds.field("date") == "2025-01-01").
+    """
+    import pyarrow.dataset as ds
+
+    directory = directory or analytics_dir()
+    if not directory:
+        raise ValueError(f"기록 디렉터리를 지정하거나 {ANALYTICS_DIR_ENV}를 설정해야 합니다.")
+    dataset = ds.dataset(directory, format="parquet", partitioning="hive")
+    return dataset.to_table(columns=columns, filter=filter)
+
+
+def _group_codes(column):
+    """(사전 인코딩된) 문자열 컬럼을 (그룹 코드 배열, 그룹 이름 리스트)로 변환한다."""
+    import pyarrow as pa
+
+    column = column.combine_chunks() if isinstance(column, pa.ChunkedArray) else column
+    if not pa.types.is_dictionary(column.type):
+        column = column.dictionary_encode()
+    codes = column.indices.fill_null(-1).to_numpy(zero_copy_only=False).astype(np.int64)
+    names = column.dictionary.to_pylist()
+    return codes, names
+
+
+# ============================================================
+# 집계
+# ============================================================
+def score_histograms(table=None, directory: Optional[str] = None) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """
+    전략별 점수 분포.
+    {전략: {"질문과의 연관성": {"하": n, "중": n, "상": n}, "답변의 구체성": {...}}}
+    """
+    if table is None:
+        table = load(["strategy", *SCORE_KEYS], directory)
+
+    codes, names = _group_codes(table.column("strategy"))
+    n_groups, n_labels = len(names), len(SCORE_LABELS)
+
+    result: Dict[str, Dict[str, Dict[str, int]]] = {name: {} for name in names}
+    for col, key in SCORE_KEYS.items():
+        scores = table.column(col).fill_null(-1).to_numpy().astype(np.int64)
+        valid = (codes >= 0) & (scores >= 0)
+        counts = np.bincount(
+            codes[valid] * n_labels + scores[valid], minlength=n_groups * n_labels
+        ).reshape(n_groups, n_labels)
+        for g, name in enumerate(names):
+            result[name][key] = dict(zip(SCORE_LABELS, counts[g].tolist()))
+    return result
+
+
+def re_evaluation_rates(table=None, directory: Optional[str] = None) -> Dict[str, Dict[str, Any]]:
+    """전략별 재평가 비율. {전략: {"turns": n, "re_evaluated": k, "rate": k/n}}"""
+    if table is None:
+        table = load(["strategy", "re_evaluated"], directory)
+
+    codes, names = _group_codes(table.column("strategy"))
+    flags = table.column("re_evaluated").fill_null(False).to_numpy(zero_copy_only=False).astype(np.int64)
+    valid = codes >= 0
+    turns = np.bincount(codes[valid], minlength=len(names))
+    re_eval = np.bincount(codes[valid], weights=flags[valid], minlength=len(names)).astype(np.int64)
+
+    return {
+        name: {
+            "turns": int(turns[g]),
+            "re_evaluated": int(re_eval[g]),
+            "rate": round(float(re_eval[g]) / int(turns[g]), 4) if turns[g] else 0.0,
+        }
+        for g, name in enumerate(names)
+    }
+
+
+def reflection_reasons(table=None, directory: Optional[str] = None) -> Dict[str, int]:
+    """재평가 사유별 건수(많은 순)."""
+    if table is None:
+        table = load(["reflection_reason"], directory)
+
+    codes, names = _group_codes(table.column("reflection_reason"))
+    counts = np.bincount(codes[codes >= 0], minlength=len(names))
+    order = np.argsort(-counts, kind="stable")
+    return {names[g]: int(counts[g]) for g in order if counts[g]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="인터뷰 평가 기록 집계")
+    parser.add_argument("--dir", default=None, help=f"기록 디렉터리 (기본: {ANALYTICS_DIR_ENV})")
+    args = parser.parse_args()
+
+    table = load(["strategy", *SCORE_KEYS, "re_evaluated", "reflection_reason"], args.dir)
+    print(json.dumps({
+        "turns": table.num_rows,
+        "score_histograms": score_histograms(table),
+        "re_evaluation_rates": re_evaluation_rates(table),
+        "reflection_reasons": reflection_reasons(table),
+    }, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
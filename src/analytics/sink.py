@@ -0,0 +1,137 @@
+# src/analytics/sink.py
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+
+# ============================================================
+# 평가 결과 컬럼형 적재 (Parquet, append-only)
+# ============================================================
+# summarize_interview 시점에 인터뷰 한 건을 턴당 한 행으로 기록한다.
+# 원문(질문/답변 텍스트)은 저장하지 않고 집계에 필요한 값만 남긴다.
+#   session_id, finished_at, turn, strategy,
+#   relevance / specificity (상=2, 중=1, 하=0, 없음=null),
+#   answer_len, re_evaluated, reflection_reason
+#
+# 파일은 인터뷰마다 하나씩 {dir}/date=YYYY-MM-DD/{session_id}.parquet 로 추가만 한다
+# (기존 파일을 고치지 않으므로 여러 워커가 동시에 써도 안전).
+#
+#   INTERVIEW_ANALYTICS_DIR : 설정하면 기록 (기본: 기록 안 함). pyarrow 필요.
+ANALYTICS_DIR_ENV = "INTERVIEW_ANALYTICS_DIR"
+
+SCORE_KEYS = {"relevance": "질문과의 연관성", "specificity": "답변의 구체성"}
+SCORE_CODES = {"하": 0, "중": 1, "상": 2}
+SCORE_LABELS = ["하", "중", "상"]
+
+_COLUMNS = (
+    "session_id", "finished_at", "turn", "strategy", "relevance", "specificity",
+    "answer_len", "re_evaluated", "reflection_reason",
+)
+
+# 파일 쓰기는 인터뷰 종료 응답을 막지 않도록 백그라운드에서 순서대로 처리
+_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="analytics")
+
+
+def analytics_dir() -> str:
+    return os.environ.get(ANALYTICS_DIR_ENV, "").strip()
+
+
+def _schema():
+    import pyarrow as pa
+
+    return pa.schema([
+        ("session_id", pa.string()),
+        ("finished_at", pa.timestamp("s")),
+        ("turn", pa.int16()),
+        ("strategy", pa.dictionary(pa.int8(), pa.string())),
+        ("relevance", pa.int8()),
+        ("specificity", pa.int8()),
+        ("answer_len", pa.int32()),
+        ("re_evaluated", pa.bool_()),
+        ("reflection_reason", pa.dictionary(pa.int8(), pa.string())),
+    ])
+
+
+# ============================================================
+# turn_rows
+# ============================================================
+def turn_rows(state: Dict[str, Any], finished_at: float = None) -> Dict[str, List[Any]]:
+    """
+    conversation/evaluation을 턴 단위 컬럼(dict of lists)으로 변환한다.
+    턴별 평가는 question_index 기준으로 매칭하며, 같은 턴의 평가가 여럿이면 마지막 값을 쓴다.
+    """
+    conversation = state.get("conversation", []) or []
+    evaluation = state.get("evaluation", []) or []
+
+    by_turn: Dict[int, Dict[str, Any]] = {}
+    for i, ev in enumerate(evaluation):
+        if isinstance(ev, dict):
+            by_turn[ev.get("question_index", i)] = ev
+
+    finished_at = int(finished_at or time.time())
+    cols: Dict[str, List[Any]] = {name: [] for name in _COLUMNS}
+    for i, turn in enumerate(conversation):
+        ev = by_turn.get(i, {})
+        cols["session_id"].append(state.get("session_id", ""))
+        cols["finished_at"].append(finished_at)
+        cols["turn"].append(i)
+        cols["strategy"].append(turn.get("strategy") or "")
+        for col, key in SCORE_KEYS.items():
+            cols[col].append(SCORE_CODES.get(ev.get(key)))
+        cols["answer_len"].append(len((turn.get("answer") or "").strip()))
+        cols["re_evaluated"].append(bool(ev.get("re_evaluated", False)))
+        cols["reflection_reason"].append(ev.get("reflection_reason") or None)
+    return cols
+
+
+# ============================================================
+# record_interview
+# ============================================================
+def _write(directory: str, session_id: str, cols: Dict[str, List[Any]], finished_at: float) -> str:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = _schema()
+    table = pa.Table.from_pydict(
+        {
+            **cols,
+            "finished_at": pa.array(cols["finished_at"], pa.int64()).cast(pa.timestamp("s")),
+        },
+        schema=schema,
+    )
+
+    part = os.path.join(directory, "date=" + time.strftime("%Y-%m-%d", time.localtime(finished_at)))
+    os.makedirs(part, exist_ok=True)
+    path = os.path.join(part, f"{session_id}.parquet")
+    # 임시 파일에 쓰고 이름을 바꿔, 읽는 쪽이 쓰다 만 파일을 보지 않게 함
+    tmp = path + ".tmp"
+    pq.write_table(table, tmp, compression="zstd")
+    os.replace(tmp, path)
+    return path
+
+
+def _write_safely(directory: str, session_id: str, cols: Dict[str, List[Any]], finished_at: float):
+    try:
+        return _write(directory, session_id, cols, finished_at)
+    except ImportError:
+        print(f"⚠ {ANALYTICS_DIR_ENV}가 설정되었지만 pyarrow가 없어 평가 기록을 건너뜁니다.")
+    except Exception as e:
+        print(f"⚠ 평가 기록 실패({session_id}): {e}")
+    return None
+
+
+def record_interview(state: Dict[str, Any]):
+    """
+    INTERVIEW_ANALYTICS_DIR가 설정된 경우 인터뷰 한 건을 백그라운드로 기록한다.
+    기록 작업의 Future를 반환한다(설정이 없거나 턴이 없으면 None).
+    """
+    directory = analytics_dir()
+    if not directory or not state.get("conversation"):
+        return None
+
+    finished_at = time.time()
+    cols = turn_rows(state, finished_at)
+    session_id = state.get("session_id") or f"{int(finished_at * 1000)}"
+    return _executor.submit(_write_safely, directory, session_id, cols, finished_at)
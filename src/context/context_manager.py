@@ -0,0 +1,82 @@
+# src/context/context_manager.py
+
+from typing import Dict, Any, List, Optional
+
+from generation import running_summary
+
+
+# 프롬프트에 원문 그대로 넣을 최근 턴 수 (state의 history_window로 세션별 조정)
+DEFAULT_HISTORY_WINDOW = 3
+
+
+# ============================================================
+# recent_turns
+# ============================================================
+def recent_turns(state: Dict[str, Any], window: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    최근 window개 턴을 {"q", "a", "strategy", "ev"} 형태로 반환한다.
+    """
+    if window is None:
+        window = int(state.get("history_window") or DEFAULT_HISTORY_WINDOW)
+
+    conversation = state.get("conversation", []) or []
+    evaluations  = state.get("evaluation", []) or []
+    start = max(0, len(conversation) - window)
+
+    turns = []
+    for i in range(start, len(conversation)):
+        turn = conversation[i]
+        ev = evaluations[i] if i < len(evaluations) and isinstance(evaluations[i], dict) else {}
+        turns.append({
+            "q": turn.get("question", ""),
+            "a": turn.get("answer", ""),
+            "strategy": turn.get("strategy", ""),
+            "ev": ev,
+        })
+    return turns
+
+
+# ============================================================
+# build_history_block
+# ============================================================
+def history_cutoff(state: Dict[str, Any], window: Optional[int] = None) -> int:
+    """원문으로 넣는 최근 window개 턴 중 첫 턴 번호(요약은 이 번호 미만의 턴까지만 반영)."""
+    if window is None:
+        window = int(state.get("history_window") or DEFAULT_HISTORY_WINDOW)
+    return max(0, len(state.get("conversation", []) or []) - window)
+
+
+def build_history_block(
+    state: Dict[str, Any],
+    window: Optional[int] = None,
+    digests: Optional[Dict[str, str]] = None,
+) -> str:
+    """
+    프롬프트용 대화 맥락을 만든다.
+      - 이전 턴: 전략별 누적 요약(running_summary)으로 압축 — 원문으로 넣는 최근 턴은 제외한 요약
+      - 최근 턴: 최근 window개만 원문
+    인터뷰가 길어져도 블록 크기는 (섹션 수 + window)에 비례해 일정하게 유지된다.
+    digests를 주지 않으면 기다리지 않고 이미 완료된 요약만 사용한다.
+    """
+    lines = []
+
+    if digests is None:
+        cutoff = history_cutoff(state, window)
+        digests = running_summary.snapshot(state["session_id"], before=cutoff) if state.get("session_id") else {}
+    if digests:
+        lines.append("[이전 대화 요약(전략별)]")
+        for sec, digest in digests.items():
+            lines.append(f"({sec})")
+            lines.append(digest.strip())
+
+    turns = recent_turns(state, window)
+    if turns:
+        lines.append("[최근 대화]")
+        for t in turns:
+            ev = {k: v for k, v in (t["ev"] or {}).items() if k not in running_summary.EVAL_META_KEYS}
+            ev_text = ", ".join(f"{k} : {v}" for k, v in ev.items()) if ev else "평가 없음"
+            lines.append(f"- ({t['strategy']}) Q: {t['q']}")
+            lines.append(f"      A: {t['a']}")
+            lines.append(f"      평가: {ev_text}")
+
+    return "\n".join(lines) if lines else "(이전 대화 없음)"
@@ -2,14 +2,45 @@
 
 from typing import Dict, Any
 
+from generation import running_summary
+from strategy.progressive import wait_ready, await_ready
+
+# 기본 인터뷰 길이 (state의 max_turns / strategy_rounds로 세션별 조정)
+DEFAULT_MAX_TURNS = 5
+DEFAULT_STRATEGY_ROUNDS = 1
+
+
 def decide_next_step(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    전체 질문 전략이 처음 필요한 시점이므로, 백그라운드 전처리(남은 전략 부문/섹션)를
+    여기서 기다려 병합한 뒤 다음 단계를 결정한다.
+    reflect/재평가를 거쳐 이번 턴의 평가가 확정되었으므로 섹션 요약 갱신도 여기서 시작한다.
+    인터뷰를 끝내는 턴은 summarize가 종합 피드백과 함께 접어 넣으므로 갱신하지 않는다.
+    """
+    ready = wait_ready(state)
+    decision = _decide({**state, **ready})
+    if decision.get("next_step") != "end":
+        running_summary.schedule_turn(state)
+    return {**ready, **decision}
+
+
+async def adecide_next_step(state: Dict[str, Any]) -> Dict[str, Any]:
+    """decide_next_step의 비동기 버전(전처리 대기 시 이벤트 루프를 막지 않음)."""
+    ready = await await_ready(state)
+    decision = _decide({**state, **ready})
+    if decision.get("next_step") != "end":
+        await running_summary.aschedule_turn(state)
+    return {**ready, **decision}
+
+
+def _decide(state: Dict[str, Any]) -> Dict[str, Any]:
     """
     (3) 인터뷰 진행 검토 : 고도화
-      - 전체 Q&A 5회 도달 → end  (우선순위 0: 명확한 종료)
-      - 첫 라운드 보장: 아직 1회 미커버 전략이 있으면 그 전략으로 전환
-      - (첫 라운드 이후) 최근 평가에 '하' 존재 → additional_question(현재 전략 유지)
+      - 전체 Q&A max_turns회 도달 → end  (우선순위 0: 명확한 종료)
+      - 라운드 보장: strategy_rounds 라운드까지는 현재 라운드 미커버 전략으로 전환
+      - (보장 라운드 이후) 최근 평가에 '하' 존재 → additional_question(현재 전략 유지)
       - (그 외) 다음 전략으로 전환
-      - 참고: '모든 전략 1회 이상 커버 → end'는 5턴 이후에만 적용(조기 종료 방지)
+      - 참고: '모든 전략 커버 → end'는 max_turns 이후에만 적용(조기 종료 방지)
     """
     # ----- 입력 상태 읽기 -----
     strategies = list(state.get("question_strategy", {}).keys())
@@ -17,37 +48,41 @@ def decide_next_step(state: Dict[str, Any]) -> Dict[str, Any]:
     conv_len   = len(state.get("conversation", []) or [])
     evals      = state.get("evaluation", []) or []
     cur_strat  = state.get("current_strategy", strategies[0] if strategies else "")
+    max_turns  = int(state.get("max_turns") or DEFAULT_MAX_TURNS)
+    rounds     = int(state.get("strategy_rounds") or DEFAULT_STRATEGY_ROUNDS)
 
     # 전략이 없으면 종료
     if not strategies:
         return {"next_step": "end"}
 
-    # (우선순위 0) Q&A 5회 제한 → 종료
-    if conv_len >= 5:
+    # (우선순위 0) Q&A max_turns회 제한 → 종료
+    if conv_len >= max_turns:
         return {"next_step": "end"}
 
-    # (우선순위 1) 첫 라운드 보장: 아직 1회도 안 한 전략이 있으면 그 전략으로 전환
-    not_covered = [s for s in strategies if coverage.get(s, 0) < 1]
+    # (우선순위 1) 라운드 보장: 진행 중인 라운드에서 아직 안 한 전략이 있으면 그 전략으로 전환
+    min_cov = min(coverage.get(s, 0) for s in strategies)
+    target  = min_cov + 1 if min_cov < rounds else 0
+    not_covered = [s for s in strategies if coverage.get(s, 0) < target]
     if not_covered:
-        # 현재 전략을 이미 1회 했으면 다음 미커버 전략으로 전환
-        if coverage.get(cur_strat, 0) >= 1:
+        # 현재 전략을 이번 라운드에 이미 했으면 다음 미커버 전략으로 전환
+        if coverage.get(cur_strat, 0) >= target:
             next_strat = not_covered[0]
             return {
                 "current_strategy": next_strat,
                 "decision": "next_strategy",
                 "next_step": "generate",
             }
-        # 아직 현재 전략이 1회 미만이면 그대로 진행(= 이번 턴에 현재 전략으로 질문 생성)
+        # 아직 현재 전략이 이번 라운드 미만이면 그대로 진행(= 이번 턴에 현재 전략으로 질문 생성)
 
-    # (옵션) 모든 전략 커버 완료 → 종료 (단, 5턴 이후에만 적용해 조기 종료 방지)
-    if all(coverage.get(s, 0) >= 1 for s in strategies) and conv_len >= 5:
+    # (옵션) 모든 전략 커버 완료 → 종료 (단, max_turns 이후에만 적용해 조기 종료 방지)
+    if all(coverage.get(s, 0) >= rounds for s in strategies) and conv_len >= max_turns:
         return {"next_step": "end"}
 
     # (첫 라운드 이후) 최근 평가 확인
     last_eval = evals[-1] if evals else {}
     rel = last_eval.get("질문과의 연관성", "중")
     spc = last_eval.get("답변의 구체성", "중")
-    if not not_covered:  # 첫 라운드가 끝난 상태에서만 '하'에 따른 꼬리질문 허용
+    if not not_covered:  # 보장 라운드가 끝난 상태에서만 '하'에 따른 꼬리질문 허용
         if rel == "하" or spc == "하":
             return {
                 "decision": "additional_question",
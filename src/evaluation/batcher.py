@@ -0,0 +1,227 @@
+# src/evaluation/batcher.py
+
+import ast
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, List, Tuple
+
+from llm.response_cache import CachedChatModel
+
+
+# ============================================================
+# 세션 간 평가 요청 마이크로 배칭
+# ============================================================
+# 여러 세션의 evaluate_answer 요청을 최대 max_wait_ms 동안 모아 한 번의 다항목 요청으로 보낸다.
+#   - 요청 수가 줄어 요청당 오버헤드와 rate-limit 슬롯 사용이 감소
+#   - 첫 요청이 들어온 시점부터 최대 max_wait_ms만 기다리므로 지연 증가는 상한이 있음
+#   - 배치 응답 파싱에 실패한 항목은 단건 요청으로 다시 평가
+#
+#   INTERVIEW_EVAL_BATCH         : 1이면 사용 (기본 0)
+#   INTERVIEW_EVAL_BATCH_MAX     : 배치 최대 항목 수 (기본 16)
+#   INTERVIEW_EVAL_BATCH_WAIT_MS : 첫 항목 이후 최대 대기 시간(ms) (기본 15)
+#   INTERVIEW_EVAL_BATCH_TIMEOUT_SEC : 호출 측이 배치 결과를 기다리는 최대 시간(초) (기본 60)
+BATCH_ENV = "INTERVIEW_EVAL_BATCH"
+BATCH_MAX_ENV = "INTERVIEW_EVAL_BATCH_MAX"
+BATCH_WAIT_ENV = "INTERVIEW_EVAL_BATCH_WAIT_MS"
+BATCH_TIMEOUT_ENV = "INTERVIEW_EVAL_BATCH_TIMEOUT_SEC"
+DEFAULT_BATCH_TIMEOUT_SEC = 60.0
+
+_BATCH_HEADER = """
+당신은 인터뷰 평가를 위한 AI 평가자입니다.
+아래 {n}개 항목을 서로 독립적으로 평가하세요.
+각 항목의 두 평가 항목을 '상/중/하'로만 평가하고, 항목 번호 순서대로
+딕셔너리 literal의 리스트 하나만 출력하세요(리스트 길이 {n}).
+[
+  {{"id": 0, "질문과의 연관성": "<상/중/하>", "답변의 구체성": "<상/중/하>"}},
+  ...
+]
+"""
+
+_BATCH_ITEM = """
+[항목 {id}]
+- 이력서 요약: {resume_summary}
+- 이력서 키워드: {resume_keywords}
+- 질문 전략({current_strategy}): {strategy}
+- 질문: {question}
+- 답변: {answer}
+"""
+
+_EVAL_KEYS = ("질문과의 연관성", "답변의 구체성")
+
+
+def batching_enabled() -> bool:
+    return os.environ.get(BATCH_ENV, "0").strip().lower() in ("1", "true", "yes", "on")
+
+
+def batch_timeout() -> float:
+    return float(os.environ.get(BATCH_TIMEOUT_ENV, DEFAULT_BATCH_TIMEOUT_SEC))
+
+
+# ============================================================
+# EvaluationDispatcher
+# ============================================================
+class EvaluationDispatcher:
+    """
+    하나의 평가 모델(llm)에 대한 배칭 디스패처.
+    submit() / asubmit()은 평가 결과(딕셔너리 literal 문자열)를 담을 Future를 반환한다.
+    """
+
+    def __init__(self, llm, max_batch: int = 16, max_wait_ms: float = 15.0):
+        self.llm = llm
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._cond = threading.Condition()
+        self._queue: List[Tuple[Dict[str, Any], Future]] = []
+        # 배치 전송 + 배치 실패 시 항목별 단건 요청을 동시에 처리할 수 있는 크기
+        self._executor = ThreadPoolExecutor(max_workers=max(8, max_batch), thread_name_prefix="eval-batch")
+        self._stats = {"items": 0, "batches": 0, "fallbacks": 0}
+
+        threading.Thread(target=self._collect_loop, name="eval-batch-collector", daemon=True).start()
+
+    # ---------- 제출 ----------
+    def submit(self, item: Dict[str, Any]) -> Future:
+        """
+        item = {"prompt": 단건 평가 프롬프트, "fields": 배치 프롬프트용 필드}
+        응답 캐시에 있으면 배치에 넣지 않고 바로 반환한다.
+        """
+        if isinstance(self.llm, CachedChatModel):
+            hit = self.llm.lookup(item["prompt"])
+            if hit is not None:
+                return self._done(hit)
+        return self._enqueue(item)
+
+    async def asubmit(self, item: Dict[str, Any]) -> Future:
+        """submit의 비동기 버전(캐시 조회를 스레드로 넘겨 이벤트 루프를 막지 않음)."""
+        if isinstance(self.llm, CachedChatModel):
+            hit = await self.llm.alookup(item["prompt"])
+            if hit is not None:
+                return self._done(hit)
+        return self._enqueue(item)
+
+    @staticmethod
+    def _done(raw: str) -> Future:
+        fut: Future = Future()
+        fut.set_result(raw)
+        return fut
+
+    def _enqueue(self, item: Dict[str, Any]) -> Future:
+        fut: Future = Future()
+        with self._cond:
+            self._queue.append((item, fut))
+            self._cond.notify()
+        return fut
+
+    def stats(self) -> Dict[str, int]:
+        with self._cond:
+            return dict(self._stats)
+
+    # ---------- 수집 루프 ----------
+    def _collect_loop(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+                deadline = time.monotonic() + self.max_wait
+                while len(self._queue) < self.max_batch:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                batch = self._queue[:self.max_batch]
+                del self._queue[:self.max_batch]
+                self._stats["items"] += len(batch)
+                self._stats["batches"] += 1
+            # 전송은 작업 스레드에서: 수집 루프는 곧바로 다음 배치를 모음
+            self._executor.submit(self._dispatch, batch)
+
+    # ---------- 전송 ----------
+    def _dispatch(self, batch: List[Tuple[Dict[str, Any], Future]]):
+        # 대기 중 취소된(호출 측 시간 초과) 항목은 보내지 않음
+        batch = [(item, fut) for item, fut in batch if not fut.done()]
+        if not batch:
+            return
+        if len(batch) == 1:
+            self._single(*batch[0])
+            return
+
+        try:
+            results = self._call_batch([item for item, _ in batch])
+        except Exception:
+            results = {}
+
+        # 항목별로 처리해, 한 항목의 예외가 나머지 Future를 미해결로 남기지 않게 함
+        for i, (item, fut) in enumerate(batch):
+            try:
+                if i in results:
+                    raw = str(results[i])
+                    self._store(item, raw)
+                    self._resolve(fut, raw)
+                else:
+                    with self._cond:
+                        self._stats["fallbacks"] += 1
+                    # 단건 요청은 순서대로가 아니라 동시에 보냄(마지막 항목이 N번의 호출을 기다리지 않게)
+                    self._executor.submit(self._single, item, fut)
+            except Exception as e:
+                if not fut.done():
+                    fut.set_exception(e)
+
+    def _call_batch(self, items: List[Dict[str, Any]]) -> Dict[int, Dict[str, str]]:
+        prompt = _BATCH_HEADER.format(n=len(items)) + "".join(
+            _BATCH_ITEM.format(id=i, **item["fields"]) for i, item in enumerate(items)
+        )
+        # 배치 프롬프트 자체는 캐시하지 않음(항목 단위로 저장)
+        llm = self.llm.llm if isinstance(self.llm, CachedChatModel) else self.llm
+        parsed = ast.literal_eval(llm.invoke(prompt).content.strip())
+
+        results = {}
+        for pos, ev in enumerate(parsed if isinstance(parsed, list) else []):
+            if not isinstance(ev, dict) or not all(ev.get(k) in ("상", "중", "하") for k in _EVAL_KEYS):
+                continue
+            idx = ev.get("id", pos)
+            if isinstance(idx, int) and 0 <= idx < len(items):
+                results[idx] = {k: ev[k] for k in _EVAL_KEYS}
+        return results
+
+    def _single(self, item: Dict[str, Any], fut: Future):
+        if fut.done():
+            return  # 호출 측이 시간 초과로 취소함
+        try:
+            raw = self.llm.invoke(item["prompt"]).content.strip()
+        except Exception as e:
+            if not fut.done():
+                fut.set_exception(e)
+            return
+        self._resolve(fut, raw)
+
+    @staticmethod
+    def _resolve(fut: Future, raw: str):
+        # 호출 측이 시간 초과로 취소했으면 결과를 버림
+        if not fut.done():
+            fut.set_result(raw)
+
+    def _store(self, item: Dict[str, Any], raw: str):
+        if isinstance(self.llm, CachedChatModel):
+            try:
+                self.llm.store(item["prompt"], raw)
+            except Exception as e:
+                # 캐시 저장 실패는 평가 결과 전달을 막지 않음
+                print(f"⚠ 평가 응답 캐시 저장 실패: {e}")
+
+
+_dispatchers: Dict[int, EvaluationDispatcher] = {}
+_dispatchers_lock = threading.Lock()
+
+
+def get_dispatcher(llm) -> EvaluationDispatcher:
+    """라우팅된 평가 모델(클라이언트)마다 디스패처 하나를 공유한다."""
+    with _dispatchers_lock:
+        if id(llm) not in _dispatchers:
+            _dispatchers[id(llm)] = EvaluationDispatcher(
+                llm,
+                max_batch=int(os.environ.get(BATCH_MAX_ENV, 16)),
+                max_wait_ms=float(os.environ.get(BATCH_WAIT_ENV, 15)),
+            )
+        return _dispatchers[id(llm)]
@@ -1,29 +1,40 @@
 # src/evaluation/evaluator.py
 
 import ast
+import asyncio
+import concurrent.futures
 import re
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 from typing import Dict, Any
 
+from llm.model_router import get_llm
+from evaluation.batcher import batching_enabled, batch_timeout, get_dispatcher
+
 
 # ==============================
 # evaluate_answer
 # ==============================
-def evaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    현재 질문/답변을 두 항목(질문과의 연관성, 답변의 구체성)으로 평가하고
-    conversation/evaluation을 갱신한 뒤 다음 스텝을 'reflect'로 설정한다.
-    """
-    llm = ChatOpenAI(model="gpt-4.1-mini", temperature=0)
+_EVAL_PROMPT = ChatPromptTemplate.from_template("""
+당신은 인터뷰 평가를 위한 AI 평가자입니다.
+[참고 정보]
+- 이력서 요약: {resume_summary}
+- 이력서 키워드: {resume_keywords}
+- 질문 전략({current_strategy}): {strategy}
+- 질문: {question}
+- 답변: {answer}
 
+아래 두 항목을 '상/중/하'로만 평가하고, 딕셔너리 literal 하나만 출력하세요.
+{{
+  "질문과의 연관성": "<상/중/하>",
+  "답변의 구체성": "<상/중/하>"
+}}
+""")
+
+
+def _eval_fields(state: Dict[str, Any]) -> Dict[str, str]:
     # --- 입력 값 추출 ---
-    current_question  = state.get("current_question", "")
-    current_answer    = state.get("current_answer", "")
     current_strategy  = state.get("current_strategy", "")
     question_strategy = state.get("question_strategy", {})
-    resume_summary    = state.get("resume_summary", "")
-    resume_keywords   = ", ".join(state.get("resume_keywords", []))
 
     # --- 질문전략 블록 추출(유연 처리) ---
     strategy_block = ""
@@ -36,34 +47,30 @@ def evaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
         except Exception:
             strategy_block = ""
 
+    return {
+        "resume_summary": state.get("resume_summary", ""),
+        "resume_keywords": ", ".join(state.get("resume_keywords", [])),
+        "strategy": strategy_block,
+        "current_strategy": current_strategy,
+        "question": state.get("current_question", ""),
+        "answer": state.get("current_answer", ""),
+    }
+
+
+def _build_eval_prompt(state: Dict[str, Any]) -> str:
     # --- 프롬프트 구성 ---
-    prompt = ChatPromptTemplate.from_template("""
-당신은 인터뷰 평가를 위한 AI 평가자입니다.
-[참고 정보]
-- 이력서 요약: {resume_summary}
-- 이력서 키워드: {resume_keywords}
-- 질문 전략({current_strategy}): {strategy}
-- 질문: {question}
-- 답변: {answer}
+    return _EVAL_PROMPT.format(**_eval_fields(state))
 
-아래 두 항목을 '상/중/하'로만 평가하고, 딕셔너리 literal 하나만 출력하세요.
-{{
-  "질문과의 연관성": "<상/중/하>",
-  "답변의 구체성": "<상/중/하>"
-}}
-""")
 
-    formatted = prompt.format(
-        resume_summary=resume_summary,
-        resume_keywords=resume_keywords,
-        strategy=strategy_block,
-        current_strategy=current_strategy,
-        question=current_question,
-        answer=current_answer,
-    )
+def _batch_item(state: Dict[str, Any]) -> Dict[str, Any]:
+    return {"prompt": _build_eval_prompt(state), "fields": _eval_fields(state)}
+
+
+def _apply_evaluation(state: Dict[str, Any], raw: str) -> Dict[str, Any]:
+    current_question = state.get("current_question", "")
+    current_answer   = state.get("current_answer", "")
 
-    # --- LLM 호출 & 결과 파싱(안전) ---
-    raw = llm.invoke(formatted).content.strip()
+    # --- 결과 파싱(안전) ---
     try:
         eval_result = ast.literal_eval(raw) if isinstance(raw, str) else raw
     except Exception:
@@ -76,10 +83,11 @@ def evaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
 
     # --- conversation 갱신(중복 최소화) ---
     conversation = list(state.get("conversation", []))
-    if not conversation or not (
+    is_new_turn = not conversation or not (
         conversation[-1].get("question") == current_question and
         conversation[-1].get("answer") == current_answer
-    ):
+    )
+    if is_new_turn:
         conversation.append({
             "question": current_question,
             "answer": current_answer,
@@ -100,6 +108,42 @@ def evaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def evaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    현재 질문/답변을 두 항목(질문과의 연관성, 답변의 구체성)으로 평가하고
+    conversation/evaluation을 갱신한 뒤 다음 스텝을 'reflect'로 설정한다.
+    """
+    llm = get_llm("evaluate_answer")
+    raw = None
+    if batching_enabled():
+        # 다른 세션의 평가와 묶어서 전송(제한 시간을 넘기면 단건 요청으로 대체)
+        fut = get_dispatcher(llm).submit(_batch_item(state))
+        try:
+            raw = fut.result(timeout=batch_timeout())
+        except concurrent.futures.TimeoutError:
+            fut.cancel()
+            print(f"⚠ 배치 평가 대기 {batch_timeout()}초 초과 — 단건 요청으로 평가")
+    if raw is None:
+        raw = llm.invoke(_build_eval_prompt(state)).content.strip()
+    return _apply_evaluation(state, raw)
+
+
+async def aevaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
+    """evaluate_answer의 비동기 버전."""
+    llm = get_llm("evaluate_answer")
+    raw = None
+    if batching_enabled():
+        fut = await get_dispatcher(llm).asubmit(_batch_item(state))
+        try:
+            raw = await asyncio.wait_for(asyncio.wrap_future(fut), timeout=batch_timeout())
+        except asyncio.TimeoutError:
+            fut.cancel()
+            print(f"⚠ 배치 평가 대기 {batch_timeout()}초 초과 — 단건 요청으로 평가")
+    if raw is None:
+        raw = (await llm.ainvoke(_build_eval_prompt(state))).content.strip()
+    return _apply_evaluation(state, raw)
+
+
 # ==============================
 # reflect 
 # ==============================
@@ -162,10 +206,7 @@ def reflect(state: Dict[str, Any]) -> Dict[str, Any]:
 # ==============================
 # re_evaluate_answer 
 # ==============================
-def re_evaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
-    llm = ChatOpenAI(model="gpt-4.1-mini", temperature=0)
-
-    prompt = ChatPromptTemplate.from_template("""
+_RE_EVAL_PROMPT = ChatPromptTemplate.from_template("""
 당신은 인터뷰 평가자입니다. 아래 질문-답변을 엄격한 기준으로 다시 평가하세요.
 규칙:
 - 답변이 짧거나(40자 미만) 근거(수치, 기간, 지표)가 없으면 낮게 평가.
@@ -180,13 +221,15 @@ def re_evaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
 {answer}
 """)
 
-    formatted = prompt.format(
+
+def _build_re_eval_prompt(state: Dict[str, Any]) -> str:
+    return _RE_EVAL_PROMPT.format(
         question=state.get("current_question", ""),
         answer=state.get("current_answer", "")
     )
 
-    raw = llm.invoke(formatted).content.strip()
 
+def _apply_re_evaluation(state: Dict[str, Any], raw: str) -> Dict[str, Any]:
     try:
         new_eval = ast.literal_eval(raw)
     except Exception:
@@ -198,6 +241,8 @@ def re_evaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
         max(0, len(state.get("conversation", [])) - 1)
     )
     new_eval["question_index"] = q_idx
+    new_eval["re_evaluated"] = True
+    new_eval["reflection_reason"] = state.get("reflection_reason", "")
 
     if prev_evals:
         prev_evals[-1] = new_eval
@@ -212,3 +257,16 @@ def re_evaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
         "next_step": "decide",
     }
 
+
+def re_evaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
+    # reflect가 평가 모순 등을 표시한 경우 상위 모델로 에스컬레이션
+    llm = get_llm("re_evaluate_answer", state)
+    raw = llm.invoke(_build_re_eval_prompt(state)).content.strip()
+    return _apply_re_evaluation(state, raw)
+
+
+async def are_evaluate_answer(state: Dict[str, Any]) -> Dict[str, Any]:
+    """re_evaluate_answer의 비동기 버전."""
+    llm = get_llm("re_evaluate_answer", state)
+    raw = (await llm.ainvoke(_build_re_eval_prompt(state))).content.strip()
+    return _apply_re_evaluation(state, raw)
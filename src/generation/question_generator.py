@@ -1,20 +1,72 @@
 # src/generation/question_generator.py
 
-from typing import Dict, Any
+import asyncio
+from collections import Counter
+from typing import Dict, Any, Optional
 
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
 
-from langchain_community.embeddings import OpenAIEmbeddings
-from langchain_community.vectorstores import Chroma
+from llm.model_router import get_llm, get_embeddings
+from llm.response_cache import cache_mode
+from generation import running_summary
+from analytics import sink as analytics_sink
+from context.context_manager import build_history_block, history_cutoff, recent_turns
+
+# 마지막 턴 이전까지의 섹션 요약을 기다리는 최대 시간(초). 초과 시 전체 Q/A 기반 보고서로 대체
+SUMMARY_WAIT_SEC = 30.0
 
 
 # ============================================================
 # generate_question 
 # ============================================================
 
-def generate_question(state: Dict[str, Any]) -> Dict[str, Any]:
+_QUESTION_PROMPT = ChatPromptTemplate.from_template(
+    """
+    당신은 전문 면접관입니다. 아래 정보를 바탕으로 지원자의 사고력/문제해결/기술적 깊이를 더 확인할 수 있도록
+    간결하고 명확한 '심화 질문 1개'만 한국어로 작성하세요. (출력은 질문 한 문장만)
+
+    [면접 포커스 영역]
+    {focus_area}
+
+    [이력서 요약]
+    {summary}
+
+    [키워드]
+    {keywords}
+
+    [이전 질문]
+    {prev_q}
+
+    [이전 답변]
+    {prev_a}
+
+    [이전 답변 평가 요약]
+    {eval_brief}
+
+    [면접 진행 맥락(이전 질문과 중복 금지)]
+    {history_block}
+
+    [참고용 유사 질문(수정 금지, 생성에만 참고)]
+    {refs_block}
+
+    요구사항:
+    - 이전 답변의 부족한 부분(연관성/구체성)을 보완하도록 유도
+    - 정량 근거(지표/수치/기간 등)나 구체 사례를 끌어내도록 구성
+    - '어떻게/무엇을 근거로/어떤 기준으로' 형태의 꼬리질문 권장
+    - 반드시 한 문장·질문부호로 끝낼 것
+    """
+)
+
+
+def _settled_history(state: Dict[str, Any]) -> bool:
+    """
+    record/replay에서는 프롬프트가 요약 완료 타이밍에 좌우되지 않도록, 최근 턴 이전까지의
+    섹션 요약이 끝나기를 기다려 사용한다(그 외에는 기다리지 않고 완료된 요약만 사용).
+    """
+    return bool(state.get("session_id")) and cache_mode() in ("record", "replay")
 
+
+def _prepare_question_inputs(state: Dict[str, Any], digests: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
     # ---------- 1) 상태 읽기 ----------
     summary      = state.get("resume_summary", "")
     keywords     = ", ".join(state.get("resume_keywords", []))
@@ -43,75 +95,35 @@ def generate_question(state: Dict[str, Any]) -> Dict[str, Any]:
                 corpus_texts.append(q)
                 metadatas.append({"source": "strategy", "area": area})
 
-    # 히스토리 질문
-    for turn in (state.get("conversation", []) or []):
-        q = turn.get("question", "")
+    # 히스토리 질문 (최근 window개만: 긴 인터뷰에서도 임베딩 비용 일정)
+    for turn in recent_turns(state):
+        q = turn["q"]
         if q:
             corpus_texts.append(q)
             metadatas.append({"source": "history", "area": "history"})
 
-    # ---------- 3) 유사 질문 검색 ----------
-    similar_refs = []
-    if corpus_texts:
-        try:
-            embeddings = OpenAIEmbeddings(model="text-embedding-3-small")
-        except TypeError:
-            embeddings = OpenAIEmbeddings()
-        vs = Chroma.from_texts(texts=corpus_texts, embedding=embeddings, metadatas=metadatas)
-
-        query_text = prev_q or (keywords or summary[:200])
-        k = min(3, len(corpus_texts))
-        docs = vs.similarity_search(query_text, k=k)
-        similar_refs = [d.page_content for d in docs]
-
-    refs_block = "\n".join(f"- {r}" for r in similar_refs) if similar_refs else "- (참고 질문 없음)"
-
-    # ---------- 4) LLM 프롬프트 ----------
-    llm = ChatOpenAI(model="gpt-4.1-mini", temperature=0.5)
-    prompt = ChatPromptTemplate.from_template(
-        """
-        당신은 전문 면접관입니다. 아래 정보를 바탕으로 지원자의 사고력/문제해결/기술적 깊이를 더 확인할 수 있도록
-        간결하고 명확한 '심화 질문 1개'만 한국어로 작성하세요. (출력은 질문 한 문장만)
-
-        [면접 포커스 영역]
-        {focus_area}
-
-        [이력서 요약]
-        {summary}
-
-        [키워드]
-        {keywords}
-
-        [이전 질문]
-        {prev_q}
+    return {
+        "prompt_vars": {
+            "focus_area": focus_area,
+            "summary": summary,
+            "keywords": keywords,
+            "prev_q": prev_q,
+            "prev_a": prev_a,
+            "eval_brief": eval_brief,
+            "history_block": build_history_block(state, digests=digests),
+        },
+        "corpus_texts": corpus_texts,
+        "metadatas": metadatas,
+        "query_text": prev_q or (keywords or summary[:200]),
+    }
 
-        [이전 답변]
-        {prev_a}
 
-        [이전 답변 평가 요약]
-        {eval_brief}
+def _refs_block(similar_refs) -> str:
+    return "\n".join(f"- {r}" for r in similar_refs) if similar_refs else "- (참고 질문 없음)"
 
-        [참고용 유사 질문(수정 금지, 생성에만 참고)]
-        {refs_block}
 
-        요구사항:
-        - 이전 답변의 부족한 부분(연관성/구체성)을 보완하도록 유도
-        - 정량 근거(지표/수치/기간 등)나 구체 사례를 끌어내도록 구성
-        - '어떻게/무엇을 근거로/어떤 기준으로' 형태의 꼬리질문 권장
-        - 반드시 한 문장·질문부호로 끝낼 것
-        """
-    )
-
-    resp = (prompt | llm).invoke({
-        "focus_area": focus_area,
-        "summary": summary,
-        "keywords": keywords,
-        "prev_q": prev_q,
-        "prev_a": prev_a,
-        "eval_brief": eval_brief,
-        "refs_block": refs_block
-    })
-    new_q = (resp.content or "").strip()
+def _finalize_question(state: Dict[str, Any], new_q: str, focus_area: str) -> Dict[str, Any]:
+    q_strategy = state.get("question_strategy", {}) or {}
 
     # ---------- 5) 간단 품질 체크 & 폴백 ----------
     used_questions = list(state.get("used_questions", []))
@@ -138,11 +150,78 @@ def generate_question(state: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def generate_question(state: Dict[str, Any]) -> Dict[str, Any]:
+    digests = None
+    if _settled_history(state):
+        digests = running_summary.collect(state["session_id"], before=history_cutoff(state))
+    inputs = _prepare_question_inputs(state, digests)
+    corpus_texts = inputs["corpus_texts"]
+
+    # ---------- 3) 유사 질문 검색 ----------
+    similar_refs = []
+    if corpus_texts:
+        # Chroma는 임포트 비용이 커서 첫 질문 생성 시점에 로드
+        from langchain_community.vectorstores import Chroma
+
+        vs = Chroma.from_texts(texts=corpus_texts, embedding=get_embeddings(), metadatas=inputs["metadatas"])
+        k = min(3, len(corpus_texts))
+        docs = vs.similarity_search(inputs["query_text"], k=k)
+        similar_refs = [d.page_content for d in docs]
+
+    # ---------- 4) LLM 프롬프트 ----------
+    llm = get_llm("generate_question")
+    resp = (_QUESTION_PROMPT | llm).invoke({**inputs["prompt_vars"], "refs_block": _refs_block(similar_refs)})
+    new_q = (resp.content or "").strip()
+
+    return _finalize_question(state, new_q, inputs["prompt_vars"]["focus_area"])
+
+
+async def agenerate_question(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    generate_question의 비동기 버전.
+    코퍼스가 수십 개 이하이므로 임베딩만 aembed로 받고 코사인 유사도는 메모리에서 계산한다.
+    """
+    digests = None
+    if _settled_history(state):
+        digests = await running_summary.acollect(state["session_id"], before=history_cutoff(state))
+    inputs = _prepare_question_inputs(state, digests)
+    corpus_texts = inputs["corpus_texts"]
+
+    # ---------- 3) 유사 질문 검색 ----------
+    similar_refs = []
+    if corpus_texts:
+        import numpy as np
+
+        embeddings = get_embeddings()
+        doc_vecs, query_vec = await asyncio.gather(
+            embeddings.aembed_documents(corpus_texts),
+            embeddings.aembed_query(inputs["query_text"]),
+        )
+        doc_vecs, query_vec = np.asarray(doc_vecs), np.asarray(query_vec)
+        scores = doc_vecs @ query_vec / (np.linalg.norm(doc_vecs, axis=1) * np.linalg.norm(query_vec) + 1e-12)
+        k = min(3, len(corpus_texts))
+        similar_refs = [corpus_texts[i] for i in np.argsort(-scores)[:k]]
+
+    # ---------- 4) LLM 프롬프트 ----------
+    llm = get_llm("generate_question")
+    resp = await (_QUESTION_PROMPT | llm).ainvoke({**inputs["prompt_vars"], "refs_block": _refs_block(similar_refs)})
+    new_q = (resp.content or "").strip()
+
+    return _finalize_question(state, new_q, inputs["prompt_vars"]["focus_area"])
+
+
 # ============================================================
 # summarize_interview 
 # ============================================================
 
-def summarize_interview(state: Dict[str, Any]) -> Dict[str, Any]:
+def _section_of(turn: Dict[str, Any], allowed_sections) -> str:
+    sec = (turn.get("strategy") or (allowed_sections[0] if allowed_sections else "")).strip()
+    if sec not in allowed_sections:
+        sec = allowed_sections[0] if allowed_sections else sec
+    return sec
+
+
+def _group_by_section(state: Dict[str, Any]):
     conversations     = state.get("conversation", []) or []
     evaluations       = state.get("evaluation", []) or []
     question_strategy = state.get("question_strategy", {}) or {}
@@ -153,15 +232,133 @@ def summarize_interview(state: Dict[str, Any]) -> Dict[str, Any]:
 
     by_section = {sec: [] for sec in allowed_sections}
     for i, turn in enumerate(conversations):
-        sec = (turn.get("strategy") or (allowed_sections[0] if allowed_sections else "")).strip()
-        if sec not in by_section:
-            sec = allowed_sections[0] if allowed_sections else sec
-
+        sec = _section_of(turn, allowed_sections)
         q = turn.get("question", "")
         a = turn.get("answer", "")
         ev = evaluations[i] if i < len(evaluations) and isinstance(evaluations[i], dict) else {}
         by_section[sec].append({"q": q, "a": a, "ev": ev})
 
+    return allowed_sections, by_section
+
+
+def _digests_complete(allowed_sections, by_section, digests) -> bool:
+    return all(sec in digests for sec in allowed_sections if by_section[sec])
+
+
+def _eval_trend(items) -> str:
+    """섹션 평가 경향: 항목별 최빈값(동률이면 최근 값)."""
+    trend = []
+    for key in ("질문과의 연관성", "답변의 구체성"):
+        values = [it["ev"].get(key) for it in reversed(items) if (it["ev"] or {}).get(key) in ("상", "중", "하")]
+        trend.append(f"{key} : {Counter(values).most_common(1)[0][0] if values else '중'}")
+    return "평가 경향: " + ", ".join(trend)
+
+
+def _sections_block_from_digests(allowed_sections, by_section, digests) -> str:
+    """섹션 요약은 LLM 없이 그대로 조립한다."""
+    section_blocks = []
+    for sec in allowed_sections:
+        items = by_section.get(sec, [])
+        if not items:
+            section_blocks.append(f"[{sec}]\n{running_summary.EMPTY_DIGEST}\n- 평가 경향: 해당 없음")
+            continue
+        section_blocks.append(f"[{sec}]\n{digests[sec].strip()}\n- {_eval_trend(items)}")
+    return "\n\n".join(section_blocks)
+
+
+def _last_turn(state: Dict[str, Any], allowed_sections):
+    """마지막 턴의 (섹션, Q/A/평가). 대화가 없으면 None."""
+    conversations = state.get("conversation", []) or []
+    if not conversations:
+        return None
+    evaluations = state.get("evaluation", []) or []
+    index = len(conversations) - 1
+    ev = evaluations[index] if index < len(evaluations) and isinstance(evaluations[index], dict) else {}
+    turn = conversations[-1]
+    item = {"q": turn.get("question", ""), "a": turn.get("answer", ""), "ev": ev}
+    return _section_of(turn, allowed_sections), item
+
+
+def _final_prompt(allowed_sections, by_section, digests, section: str, item: Dict[str, Any]) -> str:
+    """
+    마지막 턴을 해당 섹션 요약에 접어 넣는 일과 종합 피드백을 한 번의 호출로 요청한다
+    (마지막 턴은 decide에서 따로 접어 넣지 않으므로 보고서가 요약 갱신을 기다리지 않음).
+    """
+    others = "\n\n".join(
+        f"[{sec}]\n{digests[sec].strip()}" for sec in allowed_sections if sec != section and by_section.get(sec)
+    ) or "(없음)"
+    return f"""
+당신은 면접 보고서의 '{section}' 섹션 요약을 마지막 턴으로 갱신하고, 종합 피드백을 작성합니다.
+
+[다른 섹션 요약]
+{others}
+
+['{section}' 기존 요약]
+{digests.get(section) or "(없음)"}
+
+['{section}' 새 턴]
+- Q: {item["q"]}
+- A: {item["a"]}
+- 평가: {running_summary.eval_text(item["ev"])}
+
+[작성 규칙]
+- '{section}' 요약은 기존 요약에 새 턴을 반영해 세 줄로 작성.
+- '강점'은 기록에서 확인되는 근거(수치/기간/지표/구체적 사례)가 없으면 '해당 없음'.
+- 평가가 대부분 '하'이면 강점은 '해당 없음'.
+- 종합 피드백은 모든 섹션(갱신한 '{section}' 포함)을 바탕으로 작성.
+- 각 줄은 두 문장 이내로 간결하게, 형식 그대로 출력(** 기호 사용 금지).
+
+[출력 형식]
+[{section}]
+- 답변 요약:
+- 강점:
+- 약점:
+
+[종합 피드백]
+- 전체 인상:
+- 핵심 강점:
+- 핵심 보완점:
+"""
+
+
+def _split_final(text: str):
+    """_final_prompt 응답을 (갱신된 섹션 요약, 종합 피드백)으로 나눈다. 형식이 어긋나면 None."""
+    head, sep, overall = text.partition("[종합 피드백]")
+    lines = [line for line in head.strip().splitlines() if line.strip()]
+    if lines and lines[0].strip().startswith("["):
+        lines = lines[1:]
+    digest = "\n".join(lines).strip()
+    if not sep or "답변 요약" not in digest or "전체 인상" not in overall:
+        return None
+    return digest, overall.strip()
+
+
+def _report_inputs(state: Dict[str, Any], allowed_sections, by_section, digests):
+    """마지막 턴 이전 요약이 모두 있으면 (마지막 턴 섹션, Q/A/평가), 아니면 None."""
+    last = _last_turn(state, allowed_sections)
+    if last is None:
+        return None
+    section, item = last
+    # 마지막 턴 섹션은 이번 턴이 첫 턴이면 기존 요약이 없어도 됨
+    prior = {**by_section, section: by_section.get(section, [])[:-1]}
+    if not _digests_complete(allowed_sections, prior, digests):
+        return None
+    return section, item
+
+
+def _assemble_report(sections_block: str, overall: str) -> str:
+    return f"""=======================================
+[전략별 피드백]
+
+{sections_block}
+
+=======================================
+[종합 피드백]
+{overall}"""
+
+
+def _full_report_prompt(allowed_sections, by_section) -> str:
+    """섹션 요약이 없을 때(session_id 없음/요약 실패) 전체 Q/A로 보고서를 한 번에 생성한다."""
     section_materials = []
     for sec in allowed_sections:
         items = by_section.get(sec, [])
@@ -170,7 +367,7 @@ def summarize_interview(state: Dict[str, Any]) -> Dict[str, Any]:
             continue
         lines = [f"[{sec}]"]
         for j, it in enumerate(items, 1):
-            ev = {k: v for k, v in (it["ev"] or {}).items() if k != "question_index"}
+            ev = {k: v for k, v in (it["ev"] or {}).items() if k not in running_summary.EVAL_META_KEYS}
             ev_text = ", ".join(f"{k} : {v}" for k, v in ev.items()) if ev else "평가 없음"
             lines.append(f"- ({j}) Q: {it['q']}")
             lines.append(f"      A: {it['a']}")
@@ -212,16 +409,19 @@ def summarize_interview(state: Dict[str, Any]) -> Dict[str, Any]:
 - 핵심 강점:
 - 핵심 보완점:
 """
+    return prompt
 
-    llm = ChatOpenAI(model="gpt-4.1-mini", temperature=0.3)
-    summary_text = llm.invoke(prompt).content.strip()
 
+def _finish_summary(state: Dict[str, Any], summary_text: str) -> Dict[str, Any]:
     print("\n" + "=" * 60)
     print("[면접 피드백 보고서 요약 결과]")
     print("=" * 60)
     print(summary_text)
     print("=" * 60 + "\n")
 
+    # 턴 단위 평가 기록(INTERVIEW_ANALYTICS_DIR 설정 시, 백그라운드)
+    analytics_sink.record_interview(state)
+
     return {
         **state,
         "summary_report": summary_text,
@@ -229,6 +429,65 @@ def summarize_interview(state: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _finish_report(allowed_sections, by_section, digests, section: str, text: str) -> Optional[str]:
+    split = _split_final(text)
+    if split is None:
+        print("⚠ 마지막 턴 요약/종합 피드백 형식 불일치 — 전체 Q/A 기반 보고서로 대체")
+        return None
+    digest, overall = split
+    sections_block = _sections_block_from_digests(allowed_sections, by_section, {**digests, section: digest})
+    return _assemble_report(sections_block, overall)
+
+
+def summarize_interview(state: Dict[str, Any]) -> Dict[str, Any]:
+    allowed_sections, by_section = _group_by_section(state)
+    llm = get_llm("summarize_interview")
+
+    # 마지막 턴 이전까지 백그라운드로 갱신된 섹션 요약을 사용하고,
+    # 마지막 턴은 종합 피드백과 같은 호출에서 접어 넣는다(마지막 턴 지연 최소화)
+    session_id = state.get("session_id")
+    before = len(state.get("conversation", []) or []) - 1
+    digests = running_summary.collect(session_id, timeout=SUMMARY_WAIT_SEC, before=before) if session_id else {}
+    if session_id:
+        running_summary.discard(session_id)
+
+    summary_text = None
+    inputs = _report_inputs(state, allowed_sections, by_section, digests) if session_id else None
+    if inputs:
+        section, item = inputs
+        text = llm.invoke(_final_prompt(allowed_sections, by_section, digests, section, item)).content.strip()
+        summary_text = _finish_report(allowed_sections, by_section, digests, section, text)
+    if summary_text is None:
+        summary_text = llm.invoke(_full_report_prompt(allowed_sections, by_section)).content.strip()
+
+    return _finish_summary(state, summary_text)
+
+
+async def asummarize_interview(state: Dict[str, Any]) -> Dict[str, Any]:
+    """summarize_interview의 비동기 버전."""
+    allowed_sections, by_section = _group_by_section(state)
+    llm = get_llm("summarize_interview")
+
+    session_id = state.get("session_id")
+    before = len(state.get("conversation", []) or []) - 1
+    digests = (
+        await running_summary.acollect(session_id, timeout=SUMMARY_WAIT_SEC, before=before) if session_id else {}
+    )
+    if session_id:
+        running_summary.discard(session_id)
+
+    summary_text = None
+    inputs = _report_inputs(state, allowed_sections, by_section, digests) if session_id else None
+    if inputs:
+        section, item = inputs
+        text = (await llm.ainvoke(_final_prompt(allowed_sections, by_section, digests, section, item))).content.strip()
+        summary_text = _finish_report(allowed_sections, by_section, digests, section, text)
+    if summary_text is None:
+        summary_text = (await llm.ainvoke(_full_report_prompt(allowed_sections, by_section))).content.strip()
+
+    return _finish_summary(state, summary_text)
+
+
 # ============================================================
 # route_after_reflect / route_after_decide 
 # ============================================================
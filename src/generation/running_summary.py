@@ -0,0 +1,287 @@
+# src/generation/running_summary.py
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, Optional
+
+from langchain_core.prompts import ChatPromptTemplate
+
+from llm.model_router import get_llm
+
+
+# ============================================================
+# 전략(섹션)별 누적 요약
+# ============================================================
+# 턴의 평가가 확정된 뒤(reflect/재평가를 거쳐 decide 단계) 해당 섹션의 요약(digest)만 백그라운드에서 갱신한다.
+#   - digest : 해당 섹션의 모든 턴을 반영한 요약
+#   - base   : 가장 최근 턴을 제외한 요약 (같은 턴을 다시 접어 넣을 때 사용)
+#   - turn   : digest에 마지막으로 접어 넣은 턴 번호(question_index)
+#   - history: [(턴 번호, 그 턴까지 반영한 요약)] — 특정 턴 이전까지의 요약이 필요할 때 사용
+# 각 갱신 작업은 이전 요약을 기다린 뒤 새 턴 하나만 접어 넣으므로 비용이 턴 수와 무관하다.
+#   - 동기 그래프: 스레드 풀(schedule_turn, invoke). 선행 작업이 항상 먼저 시작되어 교착되지 않는다.
+#   - 비동기 그래프: 이벤트 루프의 asyncio 태스크(aschedule_turn, ainvoke)
+#
+#   INTERVIEW_SUMMARY_WORKERS : 동기 경로 스레드 풀 크기 (기본 4)
+SUMMARY_WORKERS_ENV = "INTERVIEW_SUMMARY_WORKERS"
+
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get(SUMMARY_WORKERS_ENV, 4)), thread_name_prefix="running-summary"
+)
+_lock = threading.Lock()
+# session_id → 섹션 → {"base": Future | asyncio.Task | None, "digest": ..., "turn": int | None, "history": [...]}
+_sessions: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+EMPTY_DIGEST = "- 답변 요약: 해당 없음\n- 강점: 해당 없음\n- 약점: 해당 없음"
+
+# evaluation 항목 중 점수가 아닌 기록용 키(프롬프트의 평가 텍스트에서 제외)
+EVAL_META_KEYS = ("question_index", "re_evaluated", "reflection_reason")
+
+_fold_prompt = ChatPromptTemplate.from_template("""
+당신은 면접 보고서의 '{section}' 섹션 요약을 누적 갱신합니다.
+기존 요약에 새 질문/답변/평가를 반영해 아래 형식의 세 줄만 출력하세요.
+
+[기존 요약]
+{previous}
+
+[새 턴]
+- Q: {question}
+- A: {answer}
+- 평가: {evaluation}
+
+[작성 규칙]
+- '강점'은 기록에서 확인되는 근거(수치/기간/지표/구체적 사례)가 없으면 '해당 없음'.
+- 평가가 대부분 '하'이면 강점은 '해당 없음'.
+- 각 줄은 두 문장 이내로 간결하게.
+
+[출력 형식]
+- 답변 요약:
+- 강점:
+- 약점:
+""")
+
+
+def eval_text(ev: Dict[str, Any]) -> str:
+    ev = {k: v for k, v in (ev or {}).items() if k not in EVAL_META_KEYS}
+    return ", ".join(f"{k} : {v}" for k, v in ev.items()) if ev else "평가 없음"
+
+
+def _fold_message(section: str, previous: str, item: Dict[str, Any]):
+    return _fold_prompt.format(
+        section=section,
+        previous=previous or "(없음)",
+        question=item.get("q", ""),
+        answer=item.get("a", ""),
+        evaluation=eval_text(item.get("ev", {})),
+    )
+
+
+def _fold(base: Optional[Future], section: str, item: Dict[str, Any]) -> str:
+    try:
+        previous = base.result() if base is not None else ""
+    except Exception:
+        # 선행 요약이 취소/실패해도 이 턴부터 다시 누적(이후 요약이 연쇄적으로 실패하지 않게)
+        previous = ""
+    try:
+        return get_llm("running_summary").invoke(_fold_message(section, previous, item)).content.strip()
+    except Exception:
+        # 요약 실패 시 기존 요약을 유지(최종 보고서 생성은 계속 가능)
+        return previous or EMPTY_DIGEST
+
+
+async def _afold(base, section: str, item: Dict[str, Any]) -> str:
+    """_fold의 비동기 버전(ainvoke). base는 Future 또는 asyncio.Task."""
+    previous = ""
+    if base is not None:
+        job = base if isinstance(base, asyncio.Future) else asyncio.wrap_future(base)
+        try:
+            # shield: 이 태스크가 취소돼도 선행 요약(다른 턴의 digest)은 취소하지 않음
+            previous = await asyncio.shield(job)
+        except asyncio.CancelledError:
+            if not job.cancelled():
+                raise  # 이 태스크 자체가 취소된 경우
+            previous = ""
+        except Exception:
+            previous = ""
+    try:
+        return (await get_llm("running_summary").ainvoke(_fold_message(section, previous, item))).content.strip()
+    except Exception:
+        return previous or EMPTY_DIGEST
+
+
+def _cancel(job) -> None:
+    if isinstance(job, asyncio.Task):
+        # 다른 스레드에서 호출될 수 있으므로 태스크의 루프에서 취소
+        job.get_loop().call_soon_threadsafe(job.cancel)
+    else:
+        job.cancel()
+
+
+def _ok(job) -> bool:
+    return job is not None and job.done() and not job.cancelled() and job.exception() is None
+
+
+# ============================================================
+# schedule_turn / aschedule_turn
+# ============================================================
+def _schedule(state: Dict[str, Any], submit) -> None:
+    """
+    마지막 턴을 해당 섹션 요약에 접어 넣는 작업을 등록한다.
+    이미 접어 넣은 턴이면(평가가 바뀐 경우) base 요약에서 다시 접어 넣고, 대체된 작업은 취소한다.
+    """
+    session_id = state.get("session_id")
+    conversation = state.get("conversation", []) or []
+    evaluation = state.get("evaluation", []) or []
+    if not session_id or not conversation or not evaluation:
+        return
+
+    turn = conversation[-1]
+    ev = evaluation[-1]
+    index = ev.get("question_index", len(conversation) - 1)
+    section = turn.get("strategy") or state.get("current_strategy", "")
+    item = {"q": turn.get("question", ""), "a": turn.get("answer", ""), "ev": ev}
+
+    with _lock:
+        slot = _sessions.setdefault(session_id, {}).setdefault(
+            section, {"base": None, "digest": None, "turn": None, "history": []}
+        )
+        history = slot.setdefault("history", [])
+        if slot.get("turn") == index:
+            if slot.get("ev") == ev:
+                return  # 같은 턴/같은 평가는 이미 반영(또는 진행 중)
+            if slot["digest"] is not None and not slot["digest"].done():
+                _cancel(slot["digest"])
+            if history and history[-1][0] == index:
+                history.pop()
+        else:
+            slot["base"] = slot["digest"]
+        slot["digest"] = submit(slot["base"], section, item)
+        slot["turn"], slot["ev"] = index, ev
+        history.append((index, slot["digest"]))
+
+
+def schedule_turn(state: Dict[str, Any]) -> None:
+    """확정된 마지막 턴을 스레드 풀에서 섹션 요약에 접어 넣는다."""
+    _schedule(state, lambda base, section, item: _executor.submit(_fold, base, section, item))
+
+
+async def aschedule_turn(state: Dict[str, Any]) -> None:
+    """schedule_turn의 비동기 버전. 현재 이벤트 루프에 ainvoke 태스크로 올린다."""
+    _schedule(state, lambda base, section, item: asyncio.create_task(_afold(base, section, item)))
+
+
+# ============================================================
+# collect / snapshot / export / restore / discard
+# ============================================================
+def _targets(session_id: str, before: Optional[int]) -> Dict[str, Any]:
+    """섹션별로 기다릴 작업: 최신 digest, 또는 턴 번호가 before 미만인 마지막 요약(완료 여부와 무관하게 턴 번호로만 선택)."""
+    with _lock:
+        slots = _sessions.get(session_id, {})
+        if before is None:
+            return {sec: slot["digest"] for sec, slot in slots.items() if slot["digest"]}
+        targets = {}
+        for sec, slot in slots.items():
+            for turn, fut in reversed(slot.get("history", [])):
+                if turn < before:
+                    targets[sec] = fut
+                    break
+        return targets
+
+
+def collect(session_id: str, timeout: Optional[float] = None, before: Optional[int] = None) -> Dict[str, str]:
+    """
+    진행 중인 갱신을 기다려 섹션별 요약을 반환한다(제한 시간 내 끝나지 않은 섹션은 제외).
+    before를 주면 턴 번호가 before 미만인 턴까지만 반영한 요약을 기다린다.
+    """
+    futures = _targets(session_id, before)
+    wait(futures.values(), timeout=timeout)
+    return {sec: fut.result() for sec, fut in futures.items() if _ok(fut)}
+
+
+async def acollect(session_id: str, timeout: Optional[float] = None, before: Optional[int] = None) -> Dict[str, str]:
+    """collect의 비동기 버전(이벤트 루프를 막지 않고 대기)."""
+    futures = _targets(session_id, before)
+    if futures:
+        await asyncio.wait(
+            [f if isinstance(f, asyncio.Future) else asyncio.wrap_future(f) for f in futures.values()],
+            timeout=timeout,
+        )
+    return {sec: fut.result() for sec, fut in futures.items() if _ok(fut)}
+
+
+def snapshot(session_id: str, before: Optional[int] = None) -> Dict[str, str]:
+    """
+    기다리지 않고, 이미 완료된 섹션 요약만 반환한다.
+    before를 주면 턴 번호가 before 미만인 턴까지만 반영한 요약을 반환한다(이후 턴만 있는 섹션은 제외).
+    """
+    with _lock:
+        slots = {
+            sec: dict(slot, history=list(slot.get("history", [])))
+            for sec, slot in _sessions.get(session_id, {}).items()
+        }
+
+    digests = {}
+    for sec, slot in slots.items():
+        if before is None:
+            # 최신 갱신이 진행 중이면 직전(base) 요약이라도 사용
+            candidates = (slot["digest"], slot["base"])
+        else:
+            # 해당 턴 이전 요약 중 가장 최근에 완료된 것
+            candidates = [fut for turn, fut in reversed(slot["history"]) if turn < before]
+        for fut in candidates:
+            if _ok(fut):
+                digests[sec] = fut.result()
+                break
+    return digests
+
+
+def export(session_id: str) -> Optional[Dict[str, Dict[str, Optional[str]]]]:
+    """
+    섹션별 base/digest 요약을 직렬화 가능한 dict로 반환한다(세션을 디스크로 내릴 때 사용).
+    아직 진행 중인 갱신이 있으면 None.
+    """
+    with _lock:
+        slots = dict(_sessions.get(session_id, {}))
+
+    exported = {}
+    for sec, slot in slots.items():
+        values = {"turn": slot.get("turn"), "ev": slot.get("ev")}
+        for name in ("base", "digest"):
+            fut = slot[name]
+            if fut is not None and not fut.done():
+                return None
+            values[name] = fut.result() if _ok(fut) else None
+        values["history"] = [[turn, fut.result()] for turn, fut in slot.get("history", []) if _ok(fut)]
+        exported[sec] = values
+    return exported
+
+
+def restore(session_id: str, exported: Dict[str, Dict[str, Optional[str]]]) -> None:
+    """export 결과를 완료된 Future로 되돌려 등록한다."""
+    def done(value: Optional[str]) -> Optional[Future]:
+        if value is None:
+            return None
+        fut: Future = Future()
+        fut.set_result(value)
+        return fut
+
+    with _lock:
+        _sessions[session_id] = {
+            sec: {
+                "base": done(v.get("base")),
+                "digest": done(v.get("digest")),
+                "turn": v.get("turn"),
+                "ev": v.get("ev"),
+                "history": [(turn, done(text)) for turn, text in v.get("history", [])],
+            }
+            for sec, v in (exported or {}).items()
+        }
+
+
+def discard(session_id: str) -> None:
+    with _lock:
+        slots = _sessions.pop(session_id, {})
+    for slot in slots.values():
+        if slot["digest"] is not None and not slot["digest"].done():
+            _cancel(slot["digest"])
@@ -1,24 +1,50 @@
 # src/graph/agent_v2.py
 
+import asyncio
+import hashlib
+import operator
 import os
 import random
-import fitz
-from docx import Document
-from typing import Dict, Any
-
-from langgraph.graph import StateGraph, END
+import threading
+import uuid
+from typing import Dict, Any, Annotated
 
 # === 외부 모듈 ===
-from resume.resume_parser import analyze_resume
-from strategy.strategy_generator import generate_question_strategy
-from evaluation.evaluator import evaluate_answer, reflect, re_evaluate_answer
+from resume.resume_parser import (
+    analyze_resume,
+    aanalyze_resume,
+    summarize_resume,
+    asummarize_resume,
+    extract_keywords,
+    aextract_keywords,
+    _require_resume_text,
+)
+from strategy.strategy_generator import (
+    STRATEGY_AREAS,
+    generate_question_strategy,
+    agenerate_question_strategy,
+    generate_area_strategy,
+    agenerate_area_strategy,
+)
+from strategy.progressive import start_sections, start_areas, astart_sections, astart_areas, discard
+from evaluation.evaluator import (
+    evaluate_answer,
+    aevaluate_answer,
+    reflect,
+    re_evaluate_answer,
+    are_evaluate_answer,
+)
 from generation.question_generator import (
     generate_question,
+    agenerate_question,
     summarize_interview,
+    asummarize_interview,
     route_after_reflect,
     route_after_decide
 )
-from decision.decider import decide_next_step
+from decision.decider import decide_next_step, adecide_next_step, DEFAULT_MAX_TURNS, DEFAULT_STRATEGY_ROUNDS
+from context.context_manager import DEFAULT_HISTORY_WINDOW
+from llm.response_cache import cache_mode
 
 
 # ============================================================
@@ -27,13 +53,18 @@ from decision.decider import decide_next_step
 def extract_text_from_file(file_path: str) -> str:
     ext = os.path.splitext(file_path)[1].lower()
 
+    # PyMuPDF / python-docx는 해당 형식을 처음 처리할 때 로드
     if ext == ".pdf":
+        import fitz
+
         doc = fitz.open(file_path)
         text = "\n".join(page.get_text() for page in doc)
         doc.close()
         return text
 
     elif ext == ".docx":
+        from docx import Document
+
         doc = Document(file_path)
         return "\n".join(p.text for p in doc.paragraphs if p.text.strip())
 
@@ -51,12 +82,14 @@ def update_current_answer(state: Dict[str, Any], answer: str) -> Dict[str, Any]:
 # ============================================================
 # preProcessing_Interview 
 # ============================================================
-def preProcessing_Interview(file_path: str) -> Dict[str, Any]:
-    # 파일 입력
-    resume_text = extract_text_from_file(file_path)
-
-    # state 초기화 
-    initial_state: Dict[str, Any] = {
+def _initial_state(
+    resume_text: str,
+    max_turns: int = None,
+    strategy_rounds: int = None,
+    history_window: int = None,
+) -> Dict[str, Any]:
+    return {
+        "session_id": uuid.uuid4().hex,
         "resume_text": resume_text,
         "resume_summary": "",
         "resume_keywords": [],
@@ -73,61 +106,229 @@ def preProcessing_Interview(file_path: str) -> Dict[str, Any]:
         "used_questions": [],
         "need_re_eval": False,
         "decision": "generate",
+        "max_turns": max_turns or int(os.environ.get("INTERVIEW_MAX_TURNS", DEFAULT_MAX_TURNS)),
+        "strategy_rounds": strategy_rounds or int(os.environ.get("INTERVIEW_STRATEGY_ROUNDS", DEFAULT_STRATEGY_ROUNDS)),
+        "history_window": history_window or int(os.environ.get("INTERVIEW_HISTORY_WINDOW", DEFAULT_HISTORY_WINDOW)),
     }
 
-    # Resume 분석
-    state = analyze_resume(initial_state)
 
-    # 질문 전략 수립
-    state = generate_question_strategy(state)
+# 첫 질문 부문: 이 부문 전략만 준비되면 인터뷰를 시작할 수 있음
+FIRST_AREA = "경력 및 경험"
 
+
+def _with_first_question(state: Dict[str, Any]) -> Dict[str, Any]:
     # 첫 번째 질문 생성: '경력 및 경험'에서 1개 랜덤
-    example_questions = state["question_strategy"].get("경력 및 경험", {}).get("예시질문", [])
-    selected_question = random.choice(example_questions) if example_questions else ""
+    example_questions = state["question_strategy"].get(FIRST_AREA, {}).get("예시질문", [])
+    rng = random
+    if cache_mode() in ("record", "replay"):
+        # 기록/재생 시 같은 이력서면 같은 첫 질문(이후 프롬프트가 기록과 일치하도록)
+        rng = random.Random(hashlib.sha256(state["resume_text"].encode("utf-8")).hexdigest())
+    selected_question = rng.choice(example_questions) if example_questions else ""
 
     return {
         **state,
         "current_question": selected_question,
-        "current_strategy": "경력 및 경험",
-        "strategy_coverage": {**state.get("strategy_coverage", {}), "경력 및 경험": 1},
+        "current_strategy": FIRST_AREA,
+        "strategy_coverage": {**state.get("strategy_coverage", {}), FIRST_AREA: 1},
         "used_questions": state.get("used_questions", []) + ([selected_question] if selected_question else []),
         "next_step": "evaluate",
         "reflect_flag": False,
     }
 
 
+def preProcessing_Interview(
+    file_path: str,
+    max_turns: int = None,
+    strategy_rounds: int = None,
+    history_window: int = None,
+    progressive: bool = True,
+) -> Dict[str, Any]:
+    """
+    인터뷰 길이는 인자 → 환경 변수(INTERVIEW_MAX_TURNS, INTERVIEW_STRATEGY_ROUNDS,
+    INTERVIEW_HISTORY_WINDOW) → 기본값 순으로 결정한다.
+
+    progressive=True(기본)이면 요약 → 키워드 → '경력 및 경험' 전략까지만 기다려 첫 질문을 반환하고,
+    resume_sections와 나머지 전략 부문은 백그라운드에서 채운다(decide_next_step에서 합류).
+    """
+    # 파일 입력
+    resume_text = extract_text_from_file(file_path)
+
+    # state 초기화 
+    initial_state = _initial_state(resume_text, max_turns, strategy_rounds, history_window)
+
+    if not progressive:
+        # Resume 분석
+        state = analyze_resume(initial_state)
+
+        # 질문 전략 수립
+        state = generate_question_strategy(state)
+
+        return _with_first_question(state)
+
+    # 백그라운드 작업을 등록하기 전에 검증(비-점진 경로의 analyze_resume과 같은 오류)
+    _require_resume_text(initial_state)
+
+    try:
+        # 섹션 분리는 원문만 있으면 되므로 즉시 백그라운드 시작
+        start_sections(initial_state)
+
+        resume_summary = summarize_resume(resume_text)
+        state = {
+            **initial_state,
+            "resume_summary": resume_summary,
+            "resume_keywords": extract_keywords(resume_summary),
+        }
+
+        # 나머지 부문은 백그라운드, 첫 부문만 여기서 생성
+        start_areas(state, [a for a in STRATEGY_AREAS if a != FIRST_AREA])
+        state["question_strategy"] = {FIRST_AREA: generate_area_strategy(state, FIRST_AREA)}
+
+        return _with_first_question(state)
+    except Exception:
+        # 전처리가 실패하면 세션이 만들어지지 않으므로 등록한 백그라운드 작업을 정리
+        discard(initial_state["session_id"])
+        raise
+
+
+async def apreProcessing_Interview(
+    file_path: str,
+    max_turns: int = None,
+    strategy_rounds: int = None,
+    history_window: int = None,
+    progressive: bool = True,
+) -> Dict[str, Any]:
+    """preProcessing_Interview의 비동기 버전. 파일 파싱(CPU/IO)은 스레드로 넘긴다."""
+    resume_text = await asyncio.to_thread(extract_text_from_file, file_path)
+
+    initial_state = _initial_state(resume_text, max_turns, strategy_rounds, history_window)
+
+    if not progressive:
+        state = await aanalyze_resume(initial_state)
+        state = await agenerate_question_strategy(state)
+        return _with_first_question(state)
+
+    _require_resume_text(initial_state)
+
+    try:
+        await astart_sections(initial_state)
+
+        resume_summary = await asummarize_resume(resume_text)
+        state = {
+            **initial_state,
+            "resume_summary": resume_summary,
+            "resume_keywords": await aextract_keywords(resume_summary),
+        }
+
+        await astart_areas(state, [a for a in STRATEGY_AREAS if a != FIRST_AREA])
+        state["question_strategy"] = {FIRST_AREA: await agenerate_area_strategy(state, FIRST_AREA)}
+
+        return _with_first_question(state)
+    except BaseException:
+        # 취소(CancelledError) 포함: 등록한 태스크를 정리
+        discard(initial_state["session_id"])
+        raise
+
+
 # ============================================================
 # LangGraph 구성
 # ============================================================
+def build_graph(async_mode: bool = False):
+    """
+    인터뷰 그래프를 컴파일한다.
+    async_mode=True이면 LLM 노드를 비동기 구현으로 등록한다(ainvoke 전용).
+    reflect는 LLM 호출이 없는 순수 함수라 두 모드에서 공유한다.
+    """
+    from langgraph.graph import StateGraph, END
 
-builder = StateGraph(dict)
+    # 노드는 변경된 키만 반환하기도 하므로(reflect, decide 등) 상태를 덮어쓰지 않고 병합
+    builder = StateGraph(Annotated[dict, operator.or_])
 
-builder.add_node("evaluate",    evaluate_answer)
-builder.add_node("reflect",     reflect)
-builder.add_node("re_evaluate", re_evaluate_answer)
-builder.add_node("decide",      decide_next_step)
-builder.add_node("generate",    generate_question)
-builder.add_node("summarize",   summarize_interview)
+    builder.add_node("evaluate",    aevaluate_answer if async_mode else evaluate_answer)
+    builder.add_node("reflect",     reflect)
+    builder.add_node("re_evaluate", are_evaluate_answer if async_mode else re_evaluate_answer)
+    builder.add_node("decide",      adecide_next_step if async_mode else decide_next_step)
+    builder.add_node("generate",    agenerate_question if async_mode else generate_question)
+    builder.add_node("summarize",   asummarize_interview if async_mode else summarize_interview)
 
-builder.set_entry_point("evaluate")
+    builder.set_entry_point("evaluate")
 
-builder.add_edge("evaluate", "reflect")
+    builder.add_edge("evaluate", "reflect")
 
-builder.add_conditional_edges(
-    "reflect",
-    route_after_reflect,
-    {"re_evaluate": "re_evaluate", "decide": "decide"}
-)
+    builder.add_conditional_edges(
+        "reflect",
+        route_after_reflect,
+        {"re_evaluate": "re_evaluate", "decide": "decide"}
+    )
 
-builder.add_edge("re_evaluate", "decide")
+    builder.add_edge("re_evaluate", "decide")
 
-builder.add_conditional_edges(
-    "decide",
-    route_after_decide,
-    {"generate": "generate", "summarize": "summarize"}
-)
+    builder.add_conditional_edges(
+        "decide",
+        route_after_decide,
+        {"generate": "generate", "summarize": "summarize"}
+    )
+
+    builder.add_edge("generate", END)
+    builder.add_edge("summarize", END)
+
+    return builder.compile()
+
+
+_graphs: Dict[bool, Any] = {}
+_graphs_lock = threading.Lock()
+
+
+def get_graph(async_mode: bool = False):
+    """컴파일된 그래프를 반환한다. 첫 호출 시 한 번만 컴파일한다."""
+    with _graphs_lock:
+        if async_mode not in _graphs:
+            _graphs[async_mode] = build_graph(async_mode=async_mode)
+        return _graphs[async_mode]
+
+
+def __getattr__(name: str):
+    # `from graph.agent_v2 import graph` 호환: 임포트 시점이 아닌 첫 접근 시 컴파일
+    if name == "graph":
+        return get_graph()
+    if name == "agraph":
+        return get_graph(async_mode=True)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# ============================================================
+# warmup
+# ============================================================
+def warmup(background: bool = True):
+    """
+    첫 요청 전에 무거운 모듈 로드/클라이언트 생성/그래프 컴파일을 미리 수행한다.
+    background=True이면 데몬 스레드에서 실행하고 스레드를 반환한다.
+    네트워크 호출은 하지 않는다.
+    """
+    def _run():
+        from llm.model_router import load_routing, get_llm, get_embeddings
+
+        for node in load_routing():
+            get_llm(node)
+        get_embeddings()
+
+        import fitz  # noqa: F401
+        import docx  # noqa: F401
+        from langchain_community.vectorstores import Chroma  # noqa: F401
+
+        get_graph()
+        get_graph(async_mode=True)
+
+    def _safe_run():
+        try:
+            _run()
+        except Exception as e:
+            # 워밍업 실패는 치명적이지 않음(첫 요청 시 다시 초기화)
+            print(f"⚠ warmup 실패: {e}")
 
-builder.add_edge("generate", END)
-builder.add_edge("summarize", END)
+    if not background:
+        _safe_run()
+        return None
 
-graph = builder.compile()
+    thread = threading.Thread(target=_safe_run, name="interview-warmup", daemon=True)
+    thread.start()
+    return thread
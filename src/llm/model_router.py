@@ -0,0 +1,193 @@
+# src/llm/model_router.py
+
+import json
+import os
+from typing import Dict, Any, Optional
+
+from llm.response_cache import CachedChatModel, CachedEmbeddings, cache_mode, get_cache
+from llm.simulated import SimulatedChatModel, SimulatedEmbeddings, simulation_enabled
+
+
+# ============================================================
+# 노드별 기본 모델 라우팅
+# ============================================================
+# - 키: 그래프 노드(또는 노드 내부 단계) 이름
+# - provider: "openai" | "local"(OpenAI 호환 로컬 서버: Ollama, vLLM 등) | "simulated"(부하 테스트용 모의 응답)
+# - escalate: reflect 결과(reflection_reason)에 특정 문구가 있을 때만 상위 모델로 재실행
+# - cache: 응답 캐시 사용 여부(INTERVIEW_LLM_CACHE=default일 때). 온도 0 노드만 기본 사용
+DEFAULT_ROUTING: Dict[str, Dict[str, Any]] = {
+    "resume_summary":      {"model": "gpt-4.1-mini", "temperature": 0, "cache": True},
+    "resume_sections":     {"model": "gpt-4.1-mini", "temperature": 0, "cache": True},
+    "resume_keywords":     {"model": "gpt-4.1-nano", "temperature": 0, "cache": True},
+    "question_strategy":   {"model": "gpt-4.1-mini", "temperature": 0.4},
+    "evaluate_answer":     {"model": "gpt-4.1-nano", "temperature": 0, "cache": True},
+    "re_evaluate_answer":  {
+        "model": "gpt-4.1-mini",
+        "temperature": 0,
+        "cache": True,
+        "escalate": {"model": "gpt-4.1", "when": ["평가 모순"]},
+    },
+    "generate_question":   {"model": "gpt-4.1-mini", "temperature": 0.5},
+    "summarize_interview": {"model": "gpt-4.1-mini", "temperature": 0.3},
+    "running_summary":     {"model": "gpt-4.1-mini", "temperature": 0.3},
+}
+
+# 환경 변수
+#   INTERVIEW_MODEL_ROUTING : JSON 문자열 또는 JSON 파일 경로 (노드별 설정 덮어쓰기)
+#   INTERVIEW_LOCAL_BASE_URL: provider="local" 기본 주소
+ROUTING_ENV = "INTERVIEW_MODEL_ROUTING"
+LOCAL_BASE_URL_ENV = "INTERVIEW_LOCAL_BASE_URL"
+DEFAULT_LOCAL_BASE_URL = "http://localhost:11434/v1"
+
+EMBEDDING_MODEL = "text-embedding-3-small"
+
+_routing_cache: Optional[Dict[str, Dict[str, Any]]] = None
+_client_cache: Dict[tuple, Any] = {}
+
+
+# ============================================================
+# load_routing
+# ============================================================
+def load_routing() -> Dict[str, Dict[str, Any]]:
+    """
+    기본 라우팅에 INTERVIEW_MODEL_ROUTING(JSON/파일)을 노드 단위로 덮어써서 반환한다.
+    코드 수정 없이 노드별 모델/온도/에스컬레이션 규칙을 바꿀 수 있다.
+    """
+    global _routing_cache
+    if _routing_cache is not None:
+        return _routing_cache
+
+    routing = {node: dict(cfg) for node, cfg in DEFAULT_ROUTING.items()}
+
+    raw = os.environ.get(ROUTING_ENV, "").strip()
+    if raw:
+        if os.path.exists(raw):
+            with open(raw, encoding="utf-8") as f:
+                raw = f.read()
+        try:
+            overrides = json.loads(raw)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"{ROUTING_ENV} 값을 JSON으로 해석할 수 없습니다.") from e
+
+        for node, cfg in overrides.items():
+            routing[node] = {**routing.get(node, {}), **cfg}
+
+    _routing_cache = routing
+    return routing
+
+
+def reset_routing() -> None:
+    """환경 변수를 바꾼 뒤 라우팅/클라이언트 캐시를 비운다."""
+    global _routing_cache, _embeddings
+    _routing_cache = None
+    _embeddings = None
+    _client_cache.clear()
+
+
+# ============================================================
+# resolve_model_config
+# ============================================================
+def resolve_model_config(node: str, state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    노드 설정을 반환한다. state의 reflection_reason이 escalate.when 문구 중 하나를 포함하면
+    escalate에 지정된 값(model 등)으로 덮어쓴다.
+    """
+    routing = load_routing()
+    cfg = dict(routing.get(node) or {"model": "gpt-4.1-mini", "temperature": 0})
+    escalate = cfg.pop("escalate", None)
+
+    if escalate and state is not None:
+        reason = state.get("reflection_reason", "") or ""
+        if any(w in reason for w in escalate.get("when", [])):
+            cfg.update({k: v for k, v in escalate.items() if k != "when"})
+
+    return cfg
+
+
+# ============================================================
+# get_llm
+# ============================================================
+def get_llm(node: str, state: Optional[Dict[str, Any]] = None):
+    """
+    노드 이름으로 채팅 모델을 반환한다. 같은 설정의 클라이언트는 재사용한다.
+    응답 캐시 대상이면 CachedChatModel로 감싸서 반환한다.
+    """
+    cfg = resolve_model_config(node, state)
+    if simulation_enabled() or cfg.get("provider") == "simulated":
+        # 모의 응답은 응답 캐시에 기록하지 않음
+        key = ("simulated", node, cfg.get("model"))
+        if key not in _client_cache:
+            _client_cache[key] = SimulatedChatModel(node, cfg.get("model", ""))
+        return _client_cache[key]
+
+    mode = cache_mode()
+    use_cache = mode in ("record", "replay") or (mode == "default" and cfg.get("cache", False))
+
+    provider    = cfg.get("provider", "openai")
+    model       = cfg.get("model", "gpt-4.1-mini")
+    temperature = cfg.get("temperature", 0)
+    base_url    = cfg.get("base_url")
+
+    if provider == "local":
+        base_url = base_url or os.environ.get(LOCAL_BASE_URL_ENV, DEFAULT_LOCAL_BASE_URL)
+    elif provider != "openai":
+        raise ValueError(f"지원하지 않는 provider입니다: {provider}")
+
+    key = (provider, model, temperature, base_url, mode if use_cache else None)
+    if key not in _client_cache:
+        # langchain_openai/openai 임포트가 무거워 첫 사용 시점에 로드
+        from langchain_openai import ChatOpenAI
+
+        kwargs: Dict[str, Any] = {"model": model, "temperature": temperature}
+        if base_url:
+            kwargs["base_url"] = base_url
+        if provider == "local":
+            # 로컬 서버는 키를 검사하지 않지만 클라이언트는 값을 요구함
+            kwargs["api_key"] = cfg.get("api_key", "local")
+        elif mode == "replay":
+            # 오프라인 재생: 실제 요청은 하지 않으므로 키가 없어도 생성 가능해야 함
+            kwargs["api_key"] = os.environ.get("OPENAI_API_KEY", "replay")
+
+        client = ChatOpenAI(**kwargs)
+        if use_cache:
+            client = CachedChatModel(client, model, temperature, mode, get_cache())
+        _client_cache[key] = client
+
+    return _client_cache[key]
+
+
+# ============================================================
+# get_embeddings
+# ============================================================
+_embeddings = None
+
+
+def get_embeddings():
+    """
+    질문 검색용 임베딩 모델. record/replay 모드에서는 결과도 캐시해 오프라인 재현이 가능하다.
+    """
+    global _embeddings
+    if _embeddings is not None:
+        return _embeddings
+
+    if simulation_enabled():
+        _embeddings = SimulatedEmbeddings()
+        return _embeddings
+
+    # langchain_community는 임포트 비용이 커서 첫 사용 시점에 로드
+    from langchain_community.embeddings import OpenAIEmbeddings
+
+    mode = cache_mode()
+    kwargs: Dict[str, Any] = {}
+    if mode == "replay":
+        kwargs["openai_api_key"] = os.environ.get("OPENAI_API_KEY", "replay")
+    try:
+        embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL, **kwargs)
+    except TypeError:
+        embeddings = OpenAIEmbeddings(**kwargs)
+
+    if mode in ("record", "replay"):
+        embeddings = CachedEmbeddings(embeddings, EMBEDDING_MODEL, mode, get_cache())
+
+    _embeddings = embeddings
+    return _embeddings
@@ -0,0 +1,275 @@
+# src/llm/response_cache.py
+
+import asyncio
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import Runnable
+
+
+# ============================================================
+# 설정 (환경 변수)
+# ============================================================
+#   INTERVIEW_LLM_CACHE        : default | off | record | replay
+#       default : 라우팅에서 cache=True인 노드(온도 0 노드)만 캐시 조회/저장
+#       off     : 캐시 사용 안 함
+#       record  : 모든 노드를 실제 호출하고 응답을 기록(기존 항목 덮어쓰기)
+#       replay  : 모든 노드를 기록된 응답으로만 응답(미기록 프롬프트는 CacheMissError)
+#   INTERVIEW_LLM_CACHE_PATH   : SQLite 파일 경로
+#   INTERVIEW_LLM_CACHE_MAX_MB : 최대 크기(MB). 초과 시 오래 안 쓴 항목부터 삭제
+CACHE_MODE_ENV = "INTERVIEW_LLM_CACHE"
+CACHE_PATH_ENV = "INTERVIEW_LLM_CACHE_PATH"
+CACHE_MAX_MB_ENV = "INTERVIEW_LLM_CACHE_MAX_MB"
+
+CACHE_MODES = ("default", "off", "record", "replay")
+DEFAULT_CACHE_PATH = os.path.join(".cache", "llm_responses.sqlite")
+DEFAULT_CACHE_MAX_MB = 256
+
+# 조회 시 last_access 갱신은 모아 두었다가 put 시점 또는 이 간격(초)/건수마다 한 번에 기록
+TOUCH_FLUSH_SEC = 30.0
+TOUCH_FLUSH_MAX = 256
+
+
+class CacheMissError(RuntimeError):
+    """replay 모드에서 기록되지 않은 프롬프트가 들어온 경우."""
+
+
+def cache_mode() -> str:
+    mode = os.environ.get(CACHE_MODE_ENV, "default").strip().lower() or "default"
+    if mode not in CACHE_MODES:
+        raise ValueError(f"{CACHE_MODE_ENV} 값은 {CACHE_MODES} 중 하나여야 합니다: {mode}")
+    return mode
+
+
+def make_key(*parts: Any) -> str:
+    return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+# ============================================================
+# ResponseCache (SQLite)
+# ============================================================
+class ResponseCache:
+    """
+    프롬프트 해시 → 응답 텍스트를 저장하는 SQLite 캐시.
+    전체 크기가 max_bytes를 넘으면 마지막 사용 시각이 오래된 항목부터 90%까지 삭제한다.
+    적중 시 last_access는 메모리에 모았다가 일괄 기록하므로(LRU 근사) 조회마다 커밋하지 않는다.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS responses (
+                   key         TEXT PRIMARY KEY,
+                   kind        TEXT NOT NULL,
+                   model       TEXT,
+                   response    TEXT NOT NULL,
+                   size        INTEGER NOT NULL,
+                   created     REAL NOT NULL,
+                   last_access REAL NOT NULL
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_access ON responses(last_access)")
+        self._conn.commit()
+        self._total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        self._touched = {}  # key → 마지막 적중 시각(아직 기록 안 됨)
+        self._last_flush = time.time()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute("SELECT response FROM responses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            self._touched[key] = now
+            if len(self._touched) >= TOUCH_FLUSH_MAX or now - self._last_flush >= TOUCH_FLUSH_SEC:
+                self._flush_touched()
+                self._conn.commit()
+            return row[0]
+
+    def _flush_touched(self) -> None:
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                [(t, key) for key, t in self._touched.items()],
+            )
+            self._touched.clear()
+        self._last_flush = time.time()
+
+    def put(self, key: str, response: str, kind: str = "chat", model: str = "") -> None:
+        now = time.time()
+        size = len(response.encode("utf-8"))
+        with self._lock:
+            old = self._conn.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+            self._total += size - (old[0] if old else 0)
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, kind, model, response, size, now, now),
+            )
+            self._touched.pop(key, None)
+            # 삭제 대상을 고르기 전에 모아 둔 적중 시각을 반영
+            self._flush_touched()
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        if self._total <= self.max_bytes:
+            return
+        # 매 put마다 스캔하지 않도록 한 번에 90%까지 줄임
+        target = int(self.max_bytes * 0.9)
+        victims = []
+        for key, size in self._conn.execute("SELECT key, size FROM responses ORDER BY last_access"):
+            if self._total <= target:
+                break
+            victims.append((key,))
+            self._total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+
+    def stats(self) -> dict:
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        return {"entries": count, "bytes": total, "max_bytes": self.max_bytes}
+
+
+_cache: Optional[ResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache:
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            path = os.environ.get(CACHE_PATH_ENV, DEFAULT_CACHE_PATH)
+            max_mb = float(os.environ.get(CACHE_MAX_MB_ENV, DEFAULT_CACHE_MAX_MB))
+            _cache = ResponseCache(path, int(max_mb * 1024 * 1024))
+        return _cache
+
+
+# ============================================================
+# CachedChatModel
+# ============================================================
+def _render(value: Any) -> str:
+    """프롬프트 입력(str / PromptValue / 메시지 리스트)을 키 계산용 문자열로 만든다."""
+    if isinstance(value, str):
+        return value
+    if hasattr(value, "to_string"):
+        return value.to_string()
+    if isinstance(value, list):
+        return "\n".join(f"{getattr(m, 'type', '')}: {getattr(m, 'content', m)}" for m in value)
+    return str(value)
+
+
+class CachedChatModel(Runnable):
+    """
+    채팅 모델 앞단 캐시. 키 = hash(model, temperature, 렌더링된 프롬프트).
+    Runnable이므로 `prompt | llm` 형태로도 그대로 사용할 수 있다.
+    """
+
+    def __init__(self, llm, model: str, temperature: float, mode: str, cache: ResponseCache):
+        self.llm = llm
+        self.model = model
+        self.temperature = temperature
+        self.mode = mode
+        self.cache = cache
+
+    def _key(self, input: Any) -> str:
+        return make_key("chat", self.model, self.temperature, _render(input))
+
+    def lookup(self, input: Any) -> Optional[str]:
+        """캐시된 응답 텍스트(없으면 None). replay 모드에서 미기록이면 CacheMissError."""
+        if self.mode == "record":
+            return None
+        key = self._key(input)
+        hit = self.cache.get(key)
+        if hit is None and self.mode == "replay":
+            raise CacheMissError(f"replay 모드: 기록되지 않은 프롬프트입니다 (model={self.model}, key={key[:12]})")
+        return hit
+
+    def store(self, input: Any, content: str) -> None:
+        self.cache.put(self._key(input), content, kind="chat", model=self.model)
+
+    async def alookup(self, input: Any) -> Optional[str]:
+        """lookup의 비동기 버전(SQLite 작업을 스레드로 넘겨 이벤트 루프를 막지 않음)."""
+        return await asyncio.to_thread(self.lookup, input)
+
+    async def astore(self, input: Any, content: str) -> None:
+        await asyncio.to_thread(self.store, input, content)
+
+    def invoke(self, input: Any, config=None, **kwargs) -> AIMessage:
+        hit = self.lookup(input)
+        if hit is not None:
+            return AIMessage(content=hit)
+        resp = self.llm.invoke(input, config, **kwargs)
+        self.store(input, resp.content)
+        return resp
+
+    async def ainvoke(self, input: Any, config=None, **kwargs) -> AIMessage:
+        hit = await self.alookup(input)
+        if hit is not None:
+            return AIMessage(content=hit)
+        resp = await self.llm.ainvoke(input, config, **kwargs)
+        await self.astore(input, resp.content)
+        return resp
+
+
+# ============================================================
+# CachedEmbeddings (record/replay 시 오프라인 재현용)
+# ============================================================
+class CachedEmbeddings(Embeddings):
+    """임베딩 결과를 텍스트 단위로 캐시한다. replay 모드에서 미기록 텍스트는 CacheMissError."""
+
+    def __init__(self, embeddings, model: str, mode: str, cache: ResponseCache):
+        self.embeddings = embeddings
+        self.model = model
+        self.mode = mode
+        self.cache = cache
+
+    def _lookup(self, texts: List[str]):
+        keys = [make_key("embedding", self.model, t) for t in texts]
+        found = {}
+        if self.mode != "record":
+            for i, key in enumerate(keys):
+                hit = self.cache.get(key)
+                if hit is not None:
+                    found[i] = json.loads(hit)
+        missing = [i for i in range(len(texts)) if i not in found]
+        if missing and self.mode == "replay":
+            raise CacheMissError(f"replay 모드: 기록되지 않은 임베딩 입력 {len(missing)}건")
+        return keys, found, missing
+
+    def _store(self, keys, found, missing, vectors):
+        for i, vec in zip(missing, vectors):
+            found[i] = vec
+            self.cache.put(keys[i], json.dumps(vec), kind="embedding", model=self.model)
+        return [found[i] for i in range(len(keys))]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, missing = self._lookup(texts)
+        vectors = self.embeddings.embed_documents([texts[i] for i in missing]) if missing else []
+        return self._store(keys, found, missing, vectors)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        keys, found, missing = await asyncio.to_thread(self._lookup, texts)
+        vectors = await self.embeddings.aembed_documents([texts[i] for i in missing]) if missing else []
+        return await asyncio.to_thread(self._store, keys, found, missing, vectors)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_documents([text]))[0]
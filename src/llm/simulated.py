@@ -0,0 +1,158 @@
+# src/llm/simulated.py
+
+import asyncio
+import hashlib
+import os
+import random
+import re
+import time
+from typing import Any, Dict, List
+
+from langchain_core.embeddings import Embeddings
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import Runnable
+
+from llm.response_cache import _render
+
+
+# ============================================================
+# 부하 테스트용 모의 LLM / 임베딩
+# ============================================================
+# 실제 API를 호출하지 않고 노드별로 형식이 맞는 고정 응답을 돌려준다.
+# 지연 시간은 노드별 중앙값을 갖는 로그정규 분포에서 뽑는다(긴 꼬리 재현).
+#
+#   INTERVIEW_SIMULATE_LLM            : 1이면 모든 노드/임베딩을 모의 모델로 대체 (기본 0)
+#   INTERVIEW_SIMULATED_LATENCY_SCALE : 지연 시간 배율 (기본 1.0, 0이면 지연 없음)
+#   INTERVIEW_SIMULATED_SEED          : 지연/응답 난수 시드 (선택)
+SIMULATE_ENV = "INTERVIEW_SIMULATE_LLM"
+LATENCY_SCALE_ENV = "INTERVIEW_SIMULATED_LATENCY_SCALE"
+SEED_ENV = "INTERVIEW_SIMULATED_SEED"
+
+# 노드별 (중앙값 ms, 로그 표준편차). gpt-4.1-mini/nano 수준 응답 길이 기준의 대략적인 값
+LATENCY_PROFILE: Dict[str, tuple] = {
+    "resume_summary":      (2800, 0.35),
+    "resume_sections":     (3200, 0.35),
+    "resume_keywords":     (700, 0.30),
+    "question_strategy":   (4500, 0.40),
+    "question_strategy_area": (1600, 0.35),
+    "evaluate_answer":     (650, 0.30),
+    "evaluate_answer_batch": (1400, 0.35),
+    "re_evaluate_answer":  (1100, 0.35),
+    "generate_question":   (1300, 0.35),
+    "summarize_interview": (2200, 0.40),
+    "summarize_interview_final": (1600, 0.40),
+    "running_summary":     (1200, 0.35),
+}
+DEFAULT_LATENCY = (1000, 0.35)
+EMBEDDING_LATENCY = (180, 0.25)
+
+_AREAS = ["경력 및 경험", "동기 및 커뮤니케이션", "논리적 사고", "기술 역량 및 전문성", "성장 가능성 및 자기주도성"]
+_LABELS = ["상", "중", "하"]
+
+_rng = random.Random(os.environ.get(SEED_ENV) or None)
+
+
+def simulation_enabled() -> bool:
+    return os.environ.get(SIMULATE_ENV, "0").strip().lower() in ("1", "true", "yes", "on")
+
+
+def _latency_sec(profile: tuple) -> float:
+    scale = float(os.environ.get(LATENCY_SCALE_ENV, 1.0))
+    median_ms, sigma = profile
+    return scale * median_ms * _rng.lognormvariate(0.0, sigma) / 1000.0
+
+
+def _strategy(area: str) -> Dict[str, Any]:
+    return {
+        "질문전략": f"{area} 부문에서 이력서의 구체적 사례와 근거를 확인합니다.",
+        "예시질문": [f"{area}와 관련해 가장 기억에 남는 사례를 설명해주세요.",
+                  f"{area} 측면에서 본인의 한계와 개선 방법은 무엇입니까?"],
+    }
+
+
+def _evaluation() -> Dict[str, str]:
+    return {"질문과의 연관성": _rng.choice(_LABELS), "답변의 구체성": _rng.choice(_LABELS)}
+
+
+# ============================================================
+# SimulatedChatModel
+# ============================================================
+class SimulatedChatModel(Runnable):
+    """노드별 형식에 맞는 응답을 지연 시간 뒤에 반환한다(invoke는 sleep, ainvoke는 asyncio.sleep)."""
+
+    def __init__(self, node: str, model: str):
+        self.node = node
+        self.model = model
+
+    def _respond(self, prompt: str):
+        node = self.node
+        if node == "resume_summary":
+            text = "지원자는 Python과 SQL을 활용한 데이터 분석 프로젝트를 수행했다. " * 5
+        elif node == "resume_sections":
+            text = "\n".join(f"=== {s} ===\n내용" for s in ["직무/관심", "프로젝트/활동", "기술/도구", "자격증", "추가로 물어볼 것"])
+        elif node == "resume_keywords":
+            text = "Python, SQL, 데이터 분석, 머신러닝, Docker, 협업"
+        elif node == "question_strategy" and "부문의 질문 전략" in prompt:
+            area = next((a for a in _AREAS if f"'{a}' 부문" in prompt), _AREAS[0])
+            return "question_strategy_area", str(_strategy(area))
+        elif node == "question_strategy":
+            text = str({a: _strategy(a) for a in _AREAS})
+        elif node == "evaluate_answer" and re.search(r"아래 \d+개 항목", prompt):
+            n = int(re.search(r"아래 (\d+)개 항목", prompt).group(1))
+            return "evaluate_answer_batch", str([{"id": i, **_evaluation()} for i in range(n)])
+        elif node in ("evaluate_answer", "re_evaluate_answer"):
+            text = str(_evaluation())
+        elif node == "generate_question":
+            text = f"방금 말씀하신 경험에서 성과를 어떻게 측정했는지 구체적으로 설명해주시겠어요? ({_rng.randint(1, 10**6)})"
+        elif node == "running_summary":
+            text = "- 답변 요약: 프로젝트 경험을 설명함\n- 강점: 해당 없음\n- 약점: 정량 근거 부족"
+        elif node == "summarize_interview":
+            text = "- 전체 인상: 성실함\n- 핵심 강점: 데이터 분석 경험\n- 핵심 보완점: 정량 근거 제시"
+            section = re.search(r"'(.+?)' 섹션 요약을 마지막 턴으로 갱신", prompt)
+            if section:
+                # 마지막 턴 섹션 요약 + 종합 피드백(여섯 줄)만 요청한 경우 — 전체 보고서보다 응답이 짧음
+                return "summarize_interview_final", (
+                    f"[{section.group(1)}]\n- 답변 요약: 프로젝트 경험을 설명함\n- 강점: 해당 없음\n"
+                    f"- 약점: 정량 근거 부족\n\n[종합 피드백]\n{text}"
+                )
+        else:
+            text = "응답"
+        return node, text
+
+    def invoke(self, input: Any, config=None, **kwargs) -> AIMessage:
+        profile, text = self._respond(_render(input))
+        time.sleep(_latency_sec(LATENCY_PROFILE.get(profile, DEFAULT_LATENCY)))
+        return AIMessage(content=text)
+
+    async def ainvoke(self, input: Any, config=None, **kwargs) -> AIMessage:
+        profile, text = self._respond(_render(input))
+        await asyncio.sleep(_latency_sec(LATENCY_PROFILE.get(profile, DEFAULT_LATENCY)))
+        return AIMessage(content=text)
+
+
+# ============================================================
+# SimulatedEmbeddings
+# ============================================================
+class SimulatedEmbeddings(Embeddings):
+    """텍스트 해시로 만든 결정적 벡터(1536차원)를 지연 시간 뒤에 반환한다."""
+
+    dim = 1536
+
+    def _vector(self, text: str) -> List[float]:
+        seed = int.from_bytes(hashlib.sha256(text.encode("utf-8")).digest()[:8], "big")
+        rng = random.Random(seed)
+        return [rng.uniform(-1.0, 1.0) for _ in range(self.dim)]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(_latency_sec(EMBEDDING_LATENCY))
+        return [self._vector(t) for t in texts]
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        await asyncio.sleep(_latency_sec(EMBEDDING_LATENCY))
+        return [self._vector(t) for t in texts]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_documents([text]))[0]
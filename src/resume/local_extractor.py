@@ -0,0 +1,251 @@
+# src/resume/local_extractor.py
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Tuple
+
+
+# ============================================================
+# 로컬(결정적) 키워드/섹션 추출
+# ============================================================
+# LLM 호출 없이 CPU에서 수 ms 안에 resume_keywords / resume_sections를 만든다.
+# 각 함수는 (결과, 신뢰도 0~1)을 반환하고, 신뢰도가 낮으면 호출 측에서 LLM으로 대체한다.
+
+CONFIDENCE_THRESHOLD = 0.6
+
+# ---------- 기술/도구 사전 (표기 → 대표 표기) ----------
+SKILL_DICTIONARY: Dict[str, str] = {
+    # 언어
+    # (한 글자/일반 단어와 겹치는 go, r 등은 오탐이 많아 넣지 않음)
+    "python": "Python", "파이썬": "Python", "java": "Java", "자바": "Java", "javascript": "JavaScript",
+    "자바스크립트": "JavaScript", "typescript": "TypeScript", "타입스크립트": "TypeScript", "c++": "C++", "c#": "C#",
+    "golang": "Go", "kotlin": "Kotlin", "코틀린": "Kotlin", "sql": "SQL", "scala": "Scala", "rust": "Rust",
+    # 데이터/ML
+    "pandas": "Pandas", "numpy": "NumPy", "scikit-learn": "scikit-learn", "sklearn": "scikit-learn",
+    "tensorflow": "TensorFlow", "pytorch": "PyTorch", "keras": "Keras", "xgboost": "XGBoost",
+    "lightgbm": "LightGBM", "spark": "Spark", "hadoop": "Hadoop", "airflow": "Airflow", "kafka": "Kafka",
+    "tableau": "Tableau", "power bi": "Power BI", "excel": "Excel", "엑셀": "Excel",
+    "머신러닝": "머신러닝", "machine learning": "머신러닝", "딥러닝": "딥러닝", "deep learning": "딥러닝",
+    "자연어처리": "자연어처리", "nlp": "자연어처리", "컴퓨터 비전": "컴퓨터 비전", "computer vision": "컴퓨터 비전",
+    "데이터 분석": "데이터 분석", "데이터분석": "데이터 분석", "시계열": "시계열 분석", "추천 시스템": "추천 시스템",
+    "llm": "LLM", "rag": "RAG", "langchain": "LangChain", "langgraph": "LangGraph", "openai": "OpenAI",
+    "transformer": "Transformer", "bert": "BERT", "gpt": "GPT",
+    # 백엔드/인프라
+    "spring": "Spring", "django": "Django", "flask": "Flask", "fastapi": "FastAPI", "node.js": "Node.js",
+    "react": "React", "vue": "Vue", "docker": "Docker", "kubernetes": "Kubernetes", "k8s": "Kubernetes",
+    "aws": "AWS", "gcp": "GCP", "azure": "Azure", "linux": "Linux", "git": "Git", "github": "GitHub",
+    "mysql": "MySQL", "postgresql": "PostgreSQL", "mongodb": "MongoDB", "redis": "Redis",
+    "elasticsearch": "Elasticsearch", "ci/cd": "CI/CD", "gradio": "Gradio", "streamlit": "Streamlit",
+    # 자격증
+    "정보처리기사": "정보처리기사", "sqld": "SQLD", "sqlp": "SQLP", "adsp": "ADsP", "adp": "ADP",
+    "빅데이터분석기사": "빅데이터분석기사", "toeic": "TOEIC", "opic": "OPIc", "aws saa": "AWS SAA",
+}
+
+_CERTS = {"정보처리기사", "SQLD", "SQLP", "ADsP", "ADP", "빅데이터분석기사", "TOEIC", "OPIc", "AWS SAA"}
+
+_STOPWORDS = {
+    "지원자", "경험", "프로젝트", "활용", "수행", "통해", "기반", "관련", "대한", "위한", "있는", "있으며",
+    "합니다", "했습니다", "하였으며", "사용", "및", "등", "또한", "역량", "능력", "업무", "내용", "과정", "이력서",
+    "보유", "담당", "참여", "진행",
+    "the", "and", "for", "with", "using", "from", "into", "a", "an", "am", "is", "are", "was", "were", "be",
+    "been", "of", "in", "on", "at", "to", "by", "as", "or", "it", "its", "my", "our", "we", "this", "that",
+    "led", "built", "used", "worked", "developed", "managed", "including", "over", "about", "experience",
+}
+
+# 숫자 뒤에 붙은 단위/기간(예: '12개월간', '3년', '5명') — 명사 후보가 아니라 수량 표현
+_UNIT_RE = re.compile(r"^(개월|년|주|일|시간|분|초|명|건|회|개|배|차|위)(간|차|째|동안)?$")
+
+# 한국어 명사 뒤에 붙는 조사/어미(긴 것부터 제거)
+_JOSA = sorted([
+    "으로써", "에서는", "에서의", "으로", "에서", "에게", "까지", "부터", "처럼", "하고", "이며", "이고",
+    "은", "는", "이", "가", "을", "를", "에", "의", "와", "과", "도", "로", "만",
+], key=len, reverse=True)
+
+# 용언(서술어) 어미로 끝나는 토큰은 명사 후보에서 제외
+_VERB_ENDING_RE = re.compile(r"(다|했|했고|했으며|하며|하여|해서|하고|되어|되었|였|었|는|던|ㄴ|함|됨|음)$")
+
+_TOKEN_RE = re.compile(r"[A-Za-z][A-Za-z0-9+#./\-]*|(?<=\d)[가-힣]+|[가-힣]{2,}")
+_SENTENCE_RE = re.compile(r"(?<=[.!?。])\s+|\n+")
+
+
+def _strip_josa(token: str) -> str:
+    if not re.match(r"[가-힣]", token):
+        return token
+    for j in _JOSA:
+        if token.endswith(j) and len(token) - len(j) >= 2:
+            return token[: -len(j)]
+    return token
+
+
+def _clean_token(token: str) -> str:
+    # 문장 끝 구두점('experience.', 'platform,')은 떼고, 'Node.js'처럼 안쪽 점은 유지
+    return _strip_josa(token.rstrip(".,/-"))
+
+
+# 긴 표기부터 찾아 '자바스크립트' 안의 '자바'처럼 짧은 표기가 겹쳐 잡히지 않게 함
+_DICTIONARY_TERMS = sorted(SKILL_DICTIONARY, key=len, reverse=True)
+_JOSA_ALT = "|".join(map(re.escape, _JOSA))
+
+
+def _term_pattern(term: str) -> str:
+    # 영문은 단어 경계, 한글은 앞이 한글이 아니고 뒤가 한글이 아니거나 조사인 경우만 일치
+    if re.match(r"[a-z]", term):
+        return r"(?<![a-z0-9])" + re.escape(term) + r"(?![a-z0-9])"
+    return r"(?<![가-힣])" + re.escape(term) + r"(?=(?:" + _JOSA_ALT + r")?(?![가-힣]))"
+
+
+_TERM_RES = [(re.compile(_term_pattern(term)), SKILL_DICTIONARY[term]) for term in _DICTIONARY_TERMS]
+
+
+def _dictionary_hits(text: str) -> Counter:
+    remaining = text.lower()
+    hits: Counter = Counter()
+    for pattern, canonical in _TERM_RES:
+        matches = list(pattern.finditer(remaining))
+        if not matches:
+            continue
+        hits[canonical] += len(matches)
+        # 이미 일치한 구간은 공백으로 가려 더 짧은 표기가 다시 잡지 않게 함
+        for m in reversed(matches):
+            remaining = remaining[: m.start()] + " " * (m.end() - m.start()) + remaining[m.end():]
+    return hits
+
+
+# ============================================================
+# extract_keywords_local
+# ============================================================
+def extract_keywords_local(summary: str, top_k: int = 10) -> Tuple[List[str], float]:
+    """
+    요약문에서 키워드 5~10개를 뽑는다.
+      1) 기술/도구 사전 일치 항목(빈도순)
+      2) 문장 단위 TF-IDF 상위 명사/명사구(인접 두 단어)
+    신뢰도: 사전 일치 항목 수(서로 다른 항목 5개에서 포화)와, 명사구 후보 중 불용어/용언/수량 표현 필터를
+    통과한 비율을 반반 반영한다(키워드가 5개 미만이면 절반).
+    """
+    if not summary.strip():
+        return [], 0.0
+
+    hits = _dictionary_hits(summary)
+    # 사전 항목만으로 채우지 않도록 명사구 몫을 남겨 둠
+    keywords = [k for k, _ in hits.most_common(max(1, top_k - 3))]
+
+    sentences = [s for s in _SENTENCE_RE.split(summary) if s.strip()]
+    docs = []
+    n_candidates = n_nouns = 0
+    for s in sentences:
+        tokens = [t for t in (_clean_token(t) for t in _TOKEN_RE.findall(s)) if len(t) >= 2]
+        n_candidates += len(tokens)
+        tokens = [
+            t for t in tokens
+            if t.lower() not in _STOPWORDS and not _VERB_ENDING_RE.search(t) and not _UNIT_RE.match(t)
+        ]
+        n_nouns += len(tokens)
+        bigrams = [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        docs.append(tokens + bigrams)
+
+    df = Counter(term for doc in docs for term in set(doc))
+    tf = Counter(term for doc in docs for term in doc)
+    n_docs = max(1, len(docs))
+    scores = {
+        term: tf[term] * (math.log((1 + n_docs) / (1 + df[term])) + 1.0) * (1.2 if " " in term else 1.0)
+        for term in tf
+        if tf[term] >= 2 or " " not in term
+    }
+
+    # 사전 항목의 다른 표기(예: 자바스크립트 → JavaScript)도 이미 뽑힌 것으로 취급
+    known = {k.lower() for k in keywords} | {t for t, c in SKILL_DICTIONARY.items() if c in hits}
+    for term, _ in sorted(scores.items(), key=lambda x: (-x[1], x[0])):
+        if len(keywords) >= top_k:
+            break
+        low = term.lower()
+        # 이미 뽑힌 키워드와 겹치는 구/단어는 제외
+        if low in known or any(low in k or k in low for k in known):
+            continue
+        keywords.append(term)
+        known.add(low)
+
+    keywords = keywords[:top_k]
+    noun_share = n_nouns / n_candidates if n_candidates else 0.0
+    confidence = (0.5 * min(1.0, len(hits) / 5) + 0.5 * noun_share) * (1.0 if len(keywords) >= 5 else 0.5)
+    return keywords, round(confidence, 2)
+
+
+# ============================================================
+# extract_sections_local
+# ============================================================
+SECTION_NAMES = ["직무/관심", "프로젝트/활동", "기술/도구", "자격증", "추가로 물어볼 것"]
+
+_SECTION_ALIASES: Dict[str, List[str]] = {
+    "직무/관심": ["지원 분야", "지원분야", "희망 직무", "희망직무", "관심 분야", "관심분야", "지원 동기", "지원동기",
+               "자기소개", "목표", "objective", "summary", "about me", "profile"],
+    "프로젝트/활동": ["프로젝트", "경력", "경험", "활동", "대외활동", "인턴", "연구", "projects", "project",
+                 "experience", "work experience", "activities"],
+    "기술/도구": ["기술 스택", "기술스택", "보유 기술", "보유기술", "기술", "스킬", "사용 도구", "skills", "skill",
+              "tech stack", "tools"],
+    "자격증": ["자격증", "자격 사항", "자격사항", "자격", "수상", "어학", "certifications", "certificates",
+            "certificate", "awards", "licenses"],
+}
+
+_HEADING_DECOR = re.compile(r"^[\s#■□●○◆◇▶▷\-*•\[\(【<\d.]+|[\s:：\]\)】>]+$")
+
+
+def _match_heading(line: str):
+    stripped = line.strip()
+    if not stripped or len(stripped) > 30:
+        return None
+    core = _HEADING_DECOR.sub("", stripped).strip().lower()
+    if not core:
+        return None
+    for section, aliases in _SECTION_ALIASES.items():
+        for alias in aliases:
+            if core == alias or (core.startswith(alias) and len(core) <= len(alias) + 6):
+                return section
+    return None
+
+
+def extract_sections_local(resume_text: str) -> Tuple[str, float]:
+    """
+    제목(heading) 줄을 찾아 본문을 4개 섹션으로 나누고, '추가로 물어볼 것'은 규칙으로 만든다.
+    출력 형식은 LLM 섹션 분리와 같다(=== 섹션 === / 내용).
+    신뢰도: 4개 섹션 중 제목으로 찾은 섹션 비율.
+    """
+    bodies: Dict[str, List[str]] = {s: [] for s in SECTION_NAMES}
+    current = None
+    for line in resume_text.splitlines():
+        section = _match_heading(line)
+        if section:
+            current = section
+            continue
+        if current and line.strip():
+            bodies[current].append(line.strip())
+
+    found = [s for s in SECTION_NAMES[:4] if bodies[s]]
+
+    # 제목이 없는 기술/자격증은 사전 일치로 보완
+    hits = _dictionary_hits(resume_text)
+    if not bodies["기술/도구"] and hits:
+        bodies["기술/도구"] = [", ".join(k for k in hits if k not in _CERTS)]
+    if not bodies["자격증"]:
+        certs = [k for k in hits if k in _CERTS]
+        if certs:
+            bodies["자격증"] = [", ".join(certs)]
+
+    # 추가로 물어볼 것: 기술은 있는데 프로젝트 본문에서 언급되지 않은 항목, 정량 근거 부족 등
+    followups = []
+    project_text = " ".join(bodies["프로젝트/활동"]).lower()
+    unused = [k for k in hits if k not in _CERTS and k.lower() not in project_text]
+    if unused:
+        followups.append(f"- 프로젝트에서 드러나지 않은 기술의 실제 사용 경험: {', '.join(unused[:5])}")
+    if bodies["프로젝트/활동"] and not re.search(r"\d", project_text):
+        followups.append("- 프로젝트 성과의 정량 지표(수치/기간/규모)")
+    if not bodies["직무/관심"]:
+        followups.append("- 지원 직무와 관심 분야, 지원 동기")
+    bodies["추가로 물어볼 것"] = followups
+
+    text = "\n".join(
+        f"=== {s} ===\n" + ("\n".join(bodies[s][:15]) if bodies[s] else "(이력서에 명시되지 않음)")
+        for s in SECTION_NAMES
+    )
+    return text, round(len(found) / 4, 2)
+
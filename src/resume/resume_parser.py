@@ -1,38 +1,35 @@
 # src/resume/resume_parser.py
 
+import asyncio
+import os
+
 from langchain_core.prompts import ChatPromptTemplate
-from langchain_openai import ChatOpenAI
-from langchain.output_parsers import CommaSeparatedListOutputParser
+from langchain_core.output_parsers import CommaSeparatedListOutputParser
 
-def analyze_resume(state):
-    """
-    이력서 분석 전체 함수 (요약 + 섹션 + 키워드 추출)
-    """
-    resume_text = state.get("resume_text", "")
-    if not resume_text:
-        raise ValueError("resume_text가 비어 있습니다. 먼저 텍스트를 추출해야 합니다.")
+from llm.model_router import get_llm
+from resume.local_extractor import CONFIDENCE_THRESHOLD, extract_keywords_local, extract_sections_local
 
-    # llm 준비
-    llm = ChatOpenAI(model="gpt-4.1-mini", temperature=0)
+# 키워드/섹션 추출 방식
+#   INTERVIEW_RESUME_EXTRACTOR : llm (기본) | local
+#       llm   : 항상 LLM 호출
+#       local : 로컬 추출을 먼저 시도하고, 신뢰도가 CONFIDENCE_THRESHOLD 미만일 때만 LLM 호출
+EXTRACTOR_ENV = "INTERVIEW_RESUME_EXTRACTOR"
 
-    # (1) 전체 요약
-    summary_prompt = ChatPromptTemplate.from_template(
-        """당신은 이력서를 바탕으로 인터뷰 질문을 설계하는 AI입니다.
-        다음 이력서 및 자기소개서 내용에서 질문을 뽑기 위한 중요한 내용을 10문장 정도로 요약을 해줘
-        (요약시 ** 기호는 사용하지 말것)
+# (1) 전체 요약
+_SUMMARY_PROMPT = ChatPromptTemplate.from_template(
+    """당신은 이력서를 바탕으로 인터뷰 질문을 설계하는 AI입니다.
+    다음 이력서 및 자기소개서 내용에서 질문을 뽑기 위한 중요한 내용을 10문장 정도로 요약을 해줘
+    (요약시 ** 기호는 사용하지 말것)
 - 프로젝트, 경험, 기술, 자격증, 동기 등이 드러나게 써라.
 
 본문:
 {resume_text}
 """
-    )
-    summary_msg = summary_prompt.format(resume_text=resume_text)
-    summary_resp = llm.invoke(summary_msg)
-    resume_summary = summary_resp.content.strip()
+)
 
-    # (2) 섹션 분리 요약
-    section_prompt = ChatPromptTemplate.from_template(
-        """
+# (2) 섹션 분리 요약
+_SECTION_PROMPT = ChatPromptTemplate.from_template(
+    """
 당신은 아래 이력서를 분석해서 중요한 정보를 5개 섹션으로 나누어 정리합니다.
 
 === 직무/관심 ===
@@ -49,26 +46,108 @@ def analyze_resume(state):
 본문:
 {resume_text}
 """
-    )
-    section_msg = section_prompt.format(resume_text=resume_text)
-    section_resp = llm.invoke(section_msg)
-    resume_sections = section_resp.content.strip()
+)
 
-    # (3) 키워드 추출 (쉼표 구분)
-    keyword_prompt = ChatPromptTemplate.from_template(
-        """너는 위 이력서 요약문을 바탕으로 면접 질문을 만들 핵심 키워드만 추출한다.
+# (3) 키워드 추출 (쉼표 구분)
+_KEYWORD_PROMPT = ChatPromptTemplate.from_template(
+    """너는 위 이력서 요약문을 바탕으로 면접 질문을 만들 핵심 키워드만 추출한다.
 아래 요약문을 보고 핵심 단어 5~10개만 뽑아라.
 키워드만 쉼표(,)로 구분해서 출력해라.
 
 요약문:
 {summary}
 """
-    )
-    keyword_msg = keyword_prompt.format(summary=resume_summary)
-    keyword_resp = llm.invoke(keyword_msg)
+)
+
+
+def _use_local() -> bool:
+    mode = os.environ.get(EXTRACTOR_ENV, "llm").strip().lower() or "llm"
+    if mode not in ("llm", "local"):
+        raise ValueError(f"{EXTRACTOR_ENV} 값은 llm 또는 local 이어야 합니다: {mode}")
+    return mode == "local"
+
+
+def _local_sections(resume_text):
+    """로컬 섹션 분리 결과(신뢰도가 낮으면 None)."""
+    if not _use_local():
+        return None
+    sections, confidence = extract_sections_local(resume_text)
+    return sections if confidence >= CONFIDENCE_THRESHOLD else None
+
+
+def _local_keywords(resume_summary):
+    """로컬 키워드 추출 결과(신뢰도가 낮으면 None)."""
+    if not _use_local():
+        return None
+    keywords, confidence = extract_keywords_local(resume_summary)
+    return keywords if confidence >= CONFIDENCE_THRESHOLD else None
+
+
+def _require_resume_text(state):
+    resume_text = state.get("resume_text", "")
+    # 스캔본 PDF 등은 공백/줄바꿈만 추출되므로 공백만 있는 경우도 비어 있는 것으로 봄
+    if not resume_text or not resume_text.strip():
+        raise ValueError("resume_text가 비어 있습니다. 먼저 텍스트를 추출해야 합니다.")
+    return resume_text
+
+
+# ============================================================
+# 단계별 함수 (점진적 전처리에서 개별 호출)
+# ============================================================
+def summarize_resume(resume_text):
+    resp = get_llm("resume_summary").invoke(_SUMMARY_PROMPT.format(resume_text=resume_text))
+    return resp.content.strip()
+
+
+def extract_sections(resume_text):
+    local = _local_sections(resume_text)
+    if local is not None:
+        return local
+    resp = get_llm("resume_sections").invoke(_SECTION_PROMPT.format(resume_text=resume_text))
+    return resp.content.strip()
+
 
-    parser = CommaSeparatedListOutputParser()
-    resume_keywords = parser.parse(keyword_resp.content)
+def extract_keywords(resume_summary):
+    local = _local_keywords(resume_summary)
+    if local is not None:
+        return local
+    resp = get_llm("resume_keywords").invoke(_KEYWORD_PROMPT.format(summary=resume_summary))
+    return CommaSeparatedListOutputParser().parse(resp.content)
+
+
+async def asummarize_resume(resume_text):
+    resp = await get_llm("resume_summary").ainvoke(_SUMMARY_PROMPT.format(resume_text=resume_text))
+    return resp.content.strip()
+
+
+async def aextract_sections(resume_text):
+    local = _local_sections(resume_text)
+    if local is not None:
+        return local
+    resp = await get_llm("resume_sections").ainvoke(_SECTION_PROMPT.format(resume_text=resume_text))
+    return resp.content.strip()
+
+
+async def aextract_keywords(resume_summary):
+    local = _local_keywords(resume_summary)
+    if local is not None:
+        return local
+    resp = await get_llm("resume_keywords").ainvoke(_KEYWORD_PROMPT.format(summary=resume_summary))
+    return CommaSeparatedListOutputParser().parse(resp.content)
+
+
+# ============================================================
+# analyze_resume
+# ============================================================
+def analyze_resume(state):
+    """
+    이력서 분석 전체 함수 (요약 + 섹션 + 키워드 추출)
+    """
+    resume_text = _require_resume_text(state)
+
+    resume_summary  = summarize_resume(resume_text)
+    resume_sections = extract_sections(resume_text)
+    resume_keywords = extract_keywords(resume_summary)
 
     # 최종 state 업데이트
     return {
@@ -77,3 +156,23 @@ def analyze_resume(state):
         "resume_sections": resume_sections,
         "resume_keywords": resume_keywords,
     }
+
+
+async def aanalyze_resume(state):
+    """
+    analyze_resume의 비동기 버전. 요약과 섹션 분리는 서로 독립이므로 동시에 호출한다.
+    """
+    resume_text = _require_resume_text(state)
+
+    resume_summary, resume_sections = await asyncio.gather(
+        asummarize_resume(resume_text),
+        aextract_sections(resume_text),
+    )
+    resume_keywords = await aextract_keywords(resume_summary)
+
+    return {
+        **state,
+        "resume_summary": resume_summary,
+        "resume_sections": resume_sections,
+        "resume_keywords": resume_keywords,
+    }
@@ -0,0 +1,318 @@
+# src/session/session_store.py
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from generation import running_summary
+from strategy import progressive
+
+
+# ============================================================
+# 세션 메모리 관리 (Gradio)
+# ============================================================
+# gr.State에는 세션 id만 두고, 세션 데이터(state/history/...)는 이 저장소가 관리한다.
+#   - 세션별 크기(직렬화 바이트) 추적
+#   - 유휴 시간(TTL)이 지난 세션, 그리고 전체 크기 상한을 넘으면 오래 안 쓴 세션(LRU)부터 디스크로 내림
+#   - 디스크 형식: zlib 압축한 msgpack(설치된 경우) 또는 JSON을 SQLite에 저장
+#   - 다시 접근하면 디스크에서 투명하게 복원(running_summary 섹션 요약 포함)
+#   - 디스크에서도 오래된 세션은 만료 삭제
+#
+#   INTERVIEW_SESSION_PATH        : SQLite 파일 경로 (기본 .cache/sessions.sqlite)
+#   INTERVIEW_SESSION_MAX_MB      : 메모리에 둘 세션 전체 크기 상한(MB) (기본 64)
+#   INTERVIEW_SESSION_IDLE_SEC    : 이 시간 동안 접근이 없으면 디스크로 내림 (기본 600)
+#   INTERVIEW_SESSION_EXPIRE_SEC  : 디스크에서도 이 시간이 지나면 삭제 (기본 86400)
+SESSION_PATH_ENV = "INTERVIEW_SESSION_PATH"
+SESSION_MAX_MB_ENV = "INTERVIEW_SESSION_MAX_MB"
+SESSION_IDLE_ENV = "INTERVIEW_SESSION_IDLE_SEC"
+SESSION_EXPIRE_ENV = "INTERVIEW_SESSION_EXPIRE_SEC"
+
+DEFAULT_SESSION_PATH = os.path.join(".cache", "sessions.sqlite")
+DEFAULT_SESSION_MAX_MB = 64
+DEFAULT_IDLE_SEC = 600
+DEFAULT_EXPIRE_SEC = 86400
+
+# sweep은 접근 시점과 백그라운드 타이머(요청이 없어도 유휴 세션을 내리기 위함)에서 수행하되
+# 이 간격(초)보다 자주 하지 않음
+SWEEP_INTERVAL_SEC = 5.0
+
+# 직렬화 형식 태그(첫 바이트)
+_FMT_JSON = b"J"
+_FMT_MSGPACK = b"M"
+
+
+def _encode(data: Dict[str, Any]) -> bytes:
+    try:
+        import msgpack
+        return _FMT_MSGPACK + zlib.compress(msgpack.packb(data, use_bin_type=True, default=str))
+    except ImportError:
+        return _FMT_JSON + zlib.compress(json.dumps(data, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def _decode(blob: bytes) -> Dict[str, Any]:
+    fmt, body = blob[:1], zlib.decompress(blob[1:])
+    if fmt == _FMT_MSGPACK:
+        import msgpack
+        return msgpack.unpackb(body, raw=False, strict_map_key=False)
+    return json.loads(body.decode("utf-8"))
+
+
+def _sizeof(data: Dict[str, Any]) -> int:
+    """세션 크기 = 압축 전 JSON 바이트 수(메모리 사용량의 근사치)."""
+    return len(json.dumps(data, ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def _interview_id(data: Dict[str, Any]) -> Optional[str]:
+    state = data.get("state") or {}
+    return state.get("session_id")
+
+
+# ============================================================
+# SessionStore
+# ============================================================
+class SessionStore:
+    """
+    세션 id → 세션 데이터(dict). get()으로 꺼낸 dict를 수정한 뒤 put()으로 다시 넣는다.
+    SQLite/압축 작업이 있으므로 비동기 핸들러에서는 aget/aput/acreate/adelete를 사용한다.
+    """
+
+    def __init__(self, path: str, max_bytes: int, idle_sec: float, expire_sec: float):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.idle_sec = idle_sec
+        self.expire_sec = expire_sec
+
+        self._lock = threading.RLock()
+        self._resident: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()  # LRU 순서(앞이 오래됨)
+        self._resident_bytes = 0
+        self._last_sweep = 0.0
+        self._counters = {"spills": 0, "rehydrations": 0, "expired": 0, "skipped_busy": 0}
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS sessions (
+                   session_id  TEXT PRIMARY KEY,
+                   payload     BLOB NOT NULL,
+                   size        INTEGER NOT NULL,
+                   last_access REAL NOT NULL
+               )"""
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_last_access ON sessions(last_access)")
+        self._conn.commit()
+
+    # ---------- 기본 연산 ----------
+    def create(self, data: Dict[str, Any]) -> str:
+        session_id = uuid.uuid4().hex
+        self.put(session_id, data)
+        return session_id
+
+    def get(self, session_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        """세션 데이터(메모리에 없으면 디스크에서 복원). 없거나 만료되었으면 None."""
+        if not session_id:
+            return None
+        with self._lock:
+            entry = self._resident.get(session_id)
+            if entry is None:
+                entry = self._rehydrate(session_id)
+            if entry is None:
+                return None
+            entry["last_access"] = time.time()
+            entry["in_use"] = True  # put() 전까지 처리 중인 세션으로 보고 디스크로 내리지 않음
+            self._resident.move_to_end(session_id)
+            data = entry["data"]
+        self.maybe_sweep()
+        return data
+
+    def put(self, session_id: str, data: Dict[str, Any]) -> None:
+        """세션 데이터를 저장하고 크기를 다시 잰다."""
+        size = _sizeof(data)
+        with self._lock:
+            old = self._resident.pop(session_id, None)
+            self._resident_bytes += size - (old["size"] if old else 0)
+            self._resident[session_id] = {"data": data, "size": size, "last_access": time.time(), "in_use": False}
+            if old is None:
+                # 처리 도중 디스크로 내려간 경우 남은 사본 제거
+                self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+                self._conn.commit()
+        self.maybe_sweep()
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            entry = self._resident.pop(session_id, None)
+            if entry is not None:
+                self._resident_bytes -= entry["size"]
+                self._release(entry["data"])
+            self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+            self._conn.commit()
+
+    # ---------- 비동기 버전 (이벤트 루프를 막지 않도록 스레드에서 실행) ----------
+    async def acreate(self, data: Dict[str, Any]) -> str:
+        return await asyncio.to_thread(self.create, data)
+
+    async def aget(self, session_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        return await asyncio.to_thread(self.get, session_id)
+
+    async def aput(self, session_id: str, data: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self.put, session_id, data)
+
+    async def adelete(self, session_id: str) -> None:
+        await asyncio.to_thread(self.delete, session_id)
+
+    # ---------- 디스크로 내리기 / 복원 ----------
+    def _spill(self, session_id: str) -> bool:
+        entry = self._resident[session_id]
+        data = entry["data"]
+        interview_id = _interview_id(data)
+
+        # 처리 중인 세션은 유휴 시간이 지나기 전(핸들러가 예외로 끝난 경우 등)까지 유지
+        if entry.get("in_use") and time.time() - entry["last_access"] < self.idle_sec:
+            return False
+
+        # 백그라운드 작업이 아직 실행 중인 세션은 이번에는 건너뜀(완료 후 다음 sweep에서 처리)
+        digests = running_summary.export(interview_id) if interview_id else {}
+        if digests is None or (interview_id and progressive.is_pending(data["state"])):
+            self._counters["skipped_busy"] += 1
+            return False
+
+        # 끝난 전처리 결과(전략 부문/섹션)는 state에 병합한 뒤 내림(레지스트리 항목도 여기서 정리됨)
+        if interview_id:
+            ready = progressive.take_finished(data["state"])
+            if ready:
+                data["state"] = {**data["state"], **ready}
+
+        blob = _encode({"data": data, "digests": digests})
+        self._conn.execute(
+            "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?, ?)",
+            (session_id, blob, _sizeof(data), entry["last_access"]),
+        )
+        del self._resident[session_id]
+        self._resident_bytes -= entry["size"]
+        if interview_id:
+            self._release(data)
+        self._counters["spills"] += 1
+        return True
+
+    def _rehydrate(self, session_id: str) -> Optional[Dict[str, Any]]:
+        row = self._conn.execute(
+            "SELECT payload, size, last_access FROM sessions WHERE session_id = ?", (session_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        payload, size, last_access = row
+        if time.time() - last_access > self.expire_sec:
+            return None
+
+        stored = _decode(payload)
+        data = stored["data"]
+        interview_id = _interview_id(data)
+        if interview_id and stored.get("digests"):
+            running_summary.restore(interview_id, stored["digests"])
+
+        self._conn.execute("DELETE FROM sessions WHERE session_id = ?", (session_id,))
+        self._conn.commit()
+        entry = {"data": data, "size": size, "last_access": last_access, "in_use": False}
+        self._resident[session_id] = entry
+        self._resident_bytes += size
+        self._counters["rehydrations"] += 1
+        return entry
+
+    def _release(self, data: Dict[str, Any]) -> None:
+        """세션에 딸린 백그라운드 레지스트리 항목을 정리한다."""
+        interview_id = _interview_id(data)
+        if interview_id:
+            running_summary.discard(interview_id)
+            progressive.discard(interview_id)
+
+    # ---------- 정리 ----------
+    def maybe_sweep(self) -> None:
+        now = time.time()
+        if now - self._last_sweep >= SWEEP_INTERVAL_SEC or self._resident_bytes > self.max_bytes:
+            self.sweep(now)
+
+    def sweep(self, now: Optional[float] = None) -> None:
+        """유휴 세션과 크기 상한 초과분(LRU)을 디스크로 내리고, 디스크의 만료 세션을 삭제한다."""
+        now = now or time.time()
+        with self._lock:
+            self._last_sweep = now
+
+            # TTL: 앞(오래된 것)부터 유휴 세션을 내림
+            for session_id, entry in list(self._resident.items()):
+                if now - entry["last_access"] < self.idle_sec:
+                    break
+                self._spill(session_id)
+
+            # LRU: 크기 상한을 넘으면 오래 안 쓴 세션부터 내림(가장 최근 세션은 유지)
+            for session_id in list(self._resident)[:-1]:
+                if self._resident_bytes <= self.max_bytes:
+                    break
+                self._spill(session_id)
+
+            cur = self._conn.execute("DELETE FROM sessions WHERE last_access < ?", (now - self.expire_sec,))
+            self._counters["expired"] += cur.rowcount
+            self._conn.commit()
+
+    def start_sweeper(self, interval: float = SWEEP_INTERVAL_SEC) -> None:
+        """요청이 없어도 주기적으로 sweep하는 데몬 스레드를 시작한다(여러 번 호출해도 하나만)."""
+        with self._lock:
+            if self._sweeper is not None:
+                return
+            self._sweeper = threading.Thread(
+                target=self._sweep_loop, args=(interval,), name="session-sweeper", daemon=True
+            )
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        self._stop.set()
+
+    def _sweep_loop(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.sweep()
+            except Exception as e:
+                print(f"⚠ 세션 정리(sweep) 실패: {e}")
+
+    # ---------- 지표 ----------
+    def metrics(self) -> Dict[str, Any]:
+        with self._lock:
+            spilled, spilled_bytes, spilled_raw = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(LENGTH(payload)), 0), COALESCE(SUM(size), 0) FROM sessions"
+            ).fetchone()
+            return {
+                "resident_sessions": len(self._resident),
+                "resident_bytes": self._resident_bytes,
+                "max_resident_bytes": self.max_bytes,
+                "spilled_sessions": spilled,
+                "spilled_bytes": spilled_bytes,
+                "spilled_raw_bytes": spilled_raw,
+                **self._counters,
+            }
+
+
+_store: Optional[SessionStore] = None
+_store_lock = threading.Lock()
+
+
+def get_store() -> SessionStore:
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = SessionStore(
+                path=os.environ.get(SESSION_PATH_ENV, DEFAULT_SESSION_PATH),
+                max_bytes=int(float(os.environ.get(SESSION_MAX_MB_ENV, DEFAULT_SESSION_MAX_MB)) * 1024 * 1024),
+                idle_sec=float(os.environ.get(SESSION_IDLE_ENV, DEFAULT_IDLE_SEC)),
+                expire_sec=float(os.environ.get(SESSION_EXPIRE_ENV, DEFAULT_EXPIRE_SEC)),
+            )
+            _store.start_sweeper()
+        return _store
@@ -0,0 +1,266 @@
+# src/strategy/progressive.py
+
+import asyncio
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, Any, List, Optional, Tuple
+
+from resume.resume_parser import extract_sections, aextract_sections
+from strategy.strategy_generator import STRATEGY_AREAS, generate_area_strategy, agenerate_area_strategy
+
+
+# ============================================================
+# 점진적 전처리
+# ============================================================
+# 첫 질문에 필요한 '경력 및 경험' 전략만 먼저 만들고, 나머지 전략 부문과 resume_sections는
+# 백그라운드에서 채운다. decide_next_step이 전체 전략을 처음 필요로 하는 시점에
+# wait_ready / await_ready로 합류(readiness barrier)한다.
+#   - 동기 경로: 스레드 풀(start_sections / start_areas)
+#   - 비동기 경로: 이벤트 루프의 asyncio 태스크(astart_sections / astart_areas, ainvoke 사용)
+#
+#   INTERVIEW_PREPROCESS_WORKERS : 동기 경로 스레드 풀 크기 (기본 8)
+PREPROCESS_WORKERS_ENV = "INTERVIEW_PREPROCESS_WORKERS"
+
+_executor = ThreadPoolExecutor(
+    max_workers=int(os.environ.get(PREPROCESS_WORKERS_ENV, 8)), thread_name_prefix="preprocess"
+)
+_lock = threading.Lock()
+# session_id → {작업 키("resume_sections" 또는 전략 부문): Future | asyncio.Task}
+_pending: Dict[str, Dict[str, Any]] = {}
+
+# 백그라운드 작업을 기다리는 최대 시간(초). 넘기면 남은 작업을 직접 생성/대기한다.
+READY_TIMEOUT_SEC = 60.0
+
+# 합류 시점에 실패해 다음 decide에서 다시 생성할 작업 키 목록(state 키)
+RETRY_KEY = "preprocess_retry"
+
+
+def _snapshot(state: Dict[str, Any]) -> Dict[str, Any]:
+    # 요약/키워드만 넘겨 백그라운드 작업이 state 전체를 붙잡지 않게 함
+    return {
+        "resume_summary": state.get("resume_summary", ""),
+        "resume_keywords": state.get("resume_keywords", []),
+    }
+
+
+def _register(session_id: str, jobs: Dict[str, Any]) -> None:
+    with _lock:
+        _pending.setdefault(session_id, {}).update(jobs)
+
+
+# ============================================================
+# start_sections / start_areas (스레드)
+# ============================================================
+def start_sections(state: Dict[str, Any]) -> None:
+    """resume_sections는 원문만 있으면 되므로 요약보다 먼저 시작한다."""
+    _register(state["session_id"], {"resume_sections": _executor.submit(extract_sections, state["resume_text"])})
+
+
+def start_areas(state: Dict[str, Any], areas) -> None:
+    """지정한 전략 부문들을 백그라운드로 생성한다."""
+    snapshot = _snapshot(state)
+    _register(state["session_id"], {area: _executor.submit(generate_area_strategy, snapshot, area) for area in areas})
+
+
+# ============================================================
+# astart_sections / astart_areas (asyncio 태스크)
+# ============================================================
+async def astart_sections(state: Dict[str, Any]) -> None:
+    """start_sections의 비동기 버전. 스레드를 쓰지 않고 현재 이벤트 루프에 태스크로 올린다."""
+    task = asyncio.create_task(aextract_sections(state["resume_text"]))
+    _register(state["session_id"], {"resume_sections": task})
+
+
+async def astart_areas(state: Dict[str, Any], areas) -> None:
+    """start_areas의 비동기 버전(agenerate_area_strategy 태스크)."""
+    snapshot = _snapshot(state)
+    _register(
+        state["session_id"],
+        {area: asyncio.create_task(agenerate_area_strategy(snapshot, area)) for area in areas},
+    )
+
+
+def is_pending(state: Dict[str, Any]) -> bool:
+    """아직 실행 중인 백그라운드 작업이 있으면 True(끝난 결과만 남아 있으면 False)."""
+    with _lock:
+        jobs = _pending.get(state.get("session_id"), {})
+        return any(not job.done() for job in jobs.values())
+
+
+# ============================================================
+# 결과 병합
+# ============================================================
+def _jobs(session_id: Optional[str]) -> Dict[str, Any]:
+    """등록된 작업의 사본(레지스트리에서는 빼지 않음)."""
+    with _lock:
+        return dict(_pending.get(session_id, {})) if session_id else {}
+
+
+def _forget(session_id: Optional[str], jobs: Dict[str, Any]) -> None:
+    """병합을 마친 작업만 레지스트리에서 제거한다(그 사이 새로 등록된 작업은 유지)."""
+    with _lock:
+        entry = _pending.get(session_id)
+        if entry is None:
+            return
+        for key, job in jobs.items():
+            if entry.get(key) is job:
+                del entry[key]
+        if not entry:
+            del _pending[session_id]
+
+
+def _succeeded(job) -> bool:
+    return job.done() and not job.cancelled() and job.exception() is None
+
+
+def _cancel(job) -> None:
+    if isinstance(job, asyncio.Task):
+        # 다른 스레드에서 호출될 수 있으므로 태스크의 루프에서 취소
+        job.get_loop().call_soon_threadsafe(job.cancel)
+    else:
+        job.cancel()
+
+
+def _collect(jobs: Dict[str, Any]) -> Tuple[Dict[str, Any], List[str]]:
+    """끝난 작업의 결과와, 결과를 얻지 못한 작업 키를 나눈다."""
+    results, failed = {}, []
+    for key, job in jobs.items():
+        if _succeeded(job):
+            results[key] = job.result()
+        else:
+            failed.append(key)
+    return results, failed
+
+
+def _updates(state: Dict[str, Any], results: Dict[str, Any]) -> Dict[str, Any]:
+    updates: Dict[str, Any] = {}
+    if "resume_sections" in results:
+        updates["resume_sections"] = results["resume_sections"]
+
+    areas = {k: v for k, v in results.items() if k != "resume_sections"}
+    if areas:
+        # 부문 순서는 STRATEGY_AREAS 기준으로 고정(decide_next_step의 전략 순회 순서)
+        strategy = {**(state.get("question_strategy", {}) or {}), **areas}
+        updates["question_strategy"] = {
+            **{a: strategy[a] for a in STRATEGY_AREAS if a in strategy},
+            **{a: v for a, v in strategy.items() if a not in STRATEGY_AREAS},
+        }
+    return updates
+
+
+def _finish(state: Dict[str, Any], results: Dict[str, Any], failed: List[str]) -> Dict[str, Any]:
+    updates = _updates(state, results)
+    if failed:
+        print(f"⚠ 전처리 작업 {failed} 생성 실패 — 다음 단계에서 다시 시도")
+        updates[RETRY_KEY] = failed
+    elif state.get(RETRY_KEY):
+        updates[RETRY_KEY] = []
+    return updates
+
+
+def _regenerate(state: Dict[str, Any], key: str):
+    if key == "resume_sections":
+        return extract_sections(state["resume_text"])
+    return generate_area_strategy(_snapshot(state), key)
+
+
+async def _aregenerate(state: Dict[str, Any], key: str):
+    if key == "resume_sections":
+        return await aextract_sections(state["resume_text"])
+    return await agenerate_area_strategy(_snapshot(state), key)
+
+
+def take_finished(state: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    모든 작업이 끝난 경우 결과를 state에 병합할 값으로 돌려주고 레지스트리에서 제거한다
+    (세션을 디스크로 내리기 전에 사용). 실패한 작업은 RETRY_KEY에 남겨 다음 decide에서 다시 생성한다.
+    실행 중인 작업이 있으면 아무것도 하지 않고 빈 dict.
+    """
+    session_id = state.get("session_id")
+    jobs = _jobs(session_id)
+    if not jobs or any(not job.done() for job in jobs.values()):
+        return {}
+    results, failed = _collect(jobs)
+    _forget(session_id, jobs)
+    return _finish(state, results, sorted(set(failed) | set(state.get(RETRY_KEY) or [])))
+
+
+# ============================================================
+# wait_ready / await_ready
+# ============================================================
+def wait_ready(state: Dict[str, Any], timeout: Optional[float] = READY_TIMEOUT_SEC) -> Dict[str, Any]:
+    """
+    백그라운드 전처리를 기다려 state에 병합할 값(question_strategy, resume_sections)을 반환한다.
+    timeout이 지나도 부문을 버리지 않는다: 아직 시작하지 못한 작업은 취소하고 여기서 직접 생성,
+    실행 중인 작업은 끝까지 기다리고, 실패한 작업은 다시 생성한다.
+    대기 중인 작업이 없으면 빈 dict.
+    """
+    session_id = state.get("session_id")
+    jobs = _jobs(session_id)
+    retry = list(state.get(RETRY_KEY) or [])
+    if not jobs and not retry:
+        return {}
+
+    futures = [job for job in jobs.values() if isinstance(job, Future)]
+    if futures:
+        done, not_done = wait(futures, timeout=timeout)
+        if not_done:
+            print(f"⚠ 전처리 대기 {timeout}초 초과({len(not_done)}건) — 남은 작업을 직접 생성/대기")
+            # 큐에서 대기 중인 작업은 취소(→ 아래에서 직접 생성), 실행 중인 작업은 완료까지 대기
+            wait([f for f in not_done if not f.cancel()])
+    for job in jobs.values():
+        # 다른 이벤트 루프의 태스크는 여기서 기다릴 수 없으므로 취소하고 직접 생성
+        if isinstance(job, asyncio.Task) and not job.done():
+            _cancel(job)
+
+    results, failed = _collect(jobs)
+    _forget(session_id, jobs)
+    remaining = []
+    for key in dict.fromkeys(failed + retry):
+        try:
+            results[key] = _regenerate(state, key)
+        except Exception as e:
+            print(f"⚠ '{key}' 전처리 재생성 실패: {e}")
+            remaining.append(key)
+    return _finish(state, results, remaining)
+
+
+async def await_ready(state: Dict[str, Any], timeout: Optional[float] = READY_TIMEOUT_SEC) -> Dict[str, Any]:
+    """wait_ready의 비동기 버전(이벤트 루프를 막지 않고 대기)."""
+    session_id = state.get("session_id")
+    jobs = _jobs(session_id)
+    retry = list(state.get(RETRY_KEY) or [])
+    if not jobs and not retry:
+        return {}
+
+    waiters = {key: job if isinstance(job, asyncio.Future) else asyncio.wrap_future(job) for key, job in jobs.items()}
+    if waiters:
+        done, not_done = await asyncio.wait(waiters.values(), timeout=timeout)
+        if not_done:
+            print(f"⚠ 전처리 대기 {timeout}초 초과({len(not_done)}건) — 남은 작업을 직접 생성/대기")
+            # 큐에서 대기 중인 스레드 작업은 취소(→ 아래에서 직접 생성), 나머지는 완료까지 대기
+            for job in jobs.values():
+                if isinstance(job, Future) and not job.done():
+                    job.cancel()
+            still_running = [w for w in not_done if not w.done()]
+            if still_running:
+                await asyncio.wait(still_running)
+
+    results, failed = _collect(jobs)
+    _forget(session_id, jobs)
+    remaining = []
+    for key in dict.fromkeys(failed + retry):
+        try:
+            results[key] = await _aregenerate(state, key)
+        except Exception as e:
+            print(f"⚠ '{key}' 전처리 재생성 실패: {e}")
+            remaining.append(key)
+    return _finish(state, results, remaining)
+
+
+def discard(session_id: str) -> None:
+    with _lock:
+        jobs = _pending.pop(session_id, {})
+    for job in jobs.values():
+        _cancel(job)
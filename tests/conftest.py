@@ -0,0 +1,7 @@
+# tests/conftest.py
+
+import os
+import sys
+
+# src/ 아래 모듈을 app.py와 같은 방식(최상위 패키지)으로 임포트
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
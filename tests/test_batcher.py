@@ -0,0 +1,102 @@
+# tests/test_batcher.py
+
+import asyncio
+import os
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from evaluation.batcher import EvaluationDispatcher
+from llm.response_cache import CachedChatModel, ResponseCache
+
+_FIELDS = {
+    "resume_summary": "요약", "resume_keywords": "Python", "current_strategy": "경력 및 경험",
+    "strategy": "전략", "question": "질문", "answer": "답변",
+}
+_SINGLE = "{'질문과의 연관성': '중', '답변의 구체성': '중'}"
+
+
+class FakeLLM:
+    """배치 프롬프트에는 batch_reply(n)을, 단건 프롬프트에는 _SINGLE을 delay초 뒤에 돌려준다."""
+
+    def __init__(self, batch_reply, delay: float = 0.0):
+        self.batch_reply = batch_reply
+        self.delay = delay
+        self.prompts = []
+        self._lock = threading.Lock()
+
+    def invoke(self, prompt):
+        with self._lock:
+            self.prompts.append(prompt)
+        time.sleep(self.delay)
+        if "개 항목을" in prompt:
+            n = int(prompt.split("아래 ")[1].split("개")[0])
+            return SimpleNamespace(content=self.batch_reply(n))
+        return SimpleNamespace(content=_SINGLE)
+
+
+def _items(n):
+    return [{"prompt": f"단건 프롬프트 {i}", "fields": _FIELDS} for i in range(n)]
+
+
+def _ev(i, rel="상", spc="하"):
+    return {"id": i, "질문과의 연관성": rel, "답변의 구체성": spc}
+
+
+def test_partial_and_missing_ids_fall_back_to_single_requests():
+    # id 1은 누락, id 2는 값이 잘못됨 → 두 항목만 단건 요청
+    llm = FakeLLM(lambda n: str([_ev(0), _ev(2, rel="최상"), _ev(3)]))
+    dispatcher = EvaluationDispatcher(llm, max_batch=4, max_wait_ms=50)
+
+    futures = [dispatcher.submit(item) for item in _items(4)]
+    results = [fut.result(timeout=5) for fut in futures]
+
+    assert results[0] == results[3] == str({"질문과의 연관성": "상", "답변의 구체성": "하"})
+    assert results[1] == results[2] == _SINGLE
+    assert dispatcher.stats() == {"items": 4, "batches": 1, "fallbacks": 2}
+
+
+def test_malformed_batch_reply_falls_back_in_parallel():
+    delay = 0.2
+    llm = FakeLLM(lambda n: "형식이 맞지 않는 응답", delay=delay)
+    dispatcher = EvaluationDispatcher(llm, max_batch=8, max_wait_ms=50)
+
+    start = time.monotonic()
+    futures = [dispatcher.submit(item) for item in _items(8)]
+    assert [fut.result(timeout=5) for fut in futures] == [_SINGLE] * 8
+    elapsed = time.monotonic() - start
+
+    # 배치 1회 + 단건 요청 1회분(동시 전송) — 순차였다면 9 * delay
+    assert elapsed < 4 * delay
+    assert dispatcher.stats()["fallbacks"] == 8
+
+
+def test_cancelled_future_is_not_sent_and_others_resolve():
+    llm = FakeLLM(lambda n: str([_ev(i) for i in range(n)]))
+    dispatcher = EvaluationDispatcher(llm, max_batch=3, max_wait_ms=100)
+
+    futures = [dispatcher.submit(item) for item in _items(3)]
+    assert futures[1].cancel()
+
+    assert futures[0].result(timeout=5) == futures[2].result(timeout=5)
+    assert futures[1].cancelled()
+    # 취소된 항목은 배치 프롬프트에 포함되지 않음(2개 항목 배치)
+    assert any("아래 2개 항목을" in p for p in llm.prompts)
+    assert not any("단건 프롬프트 1" in p for p in llm.prompts)
+
+
+def test_asubmit_returns_cached_response_without_queueing(tmp_path):
+    llm = FakeLLM(lambda n: "[]")
+    cache = ResponseCache(os.path.join(tmp_path, "cache.sqlite"), 1 << 20)
+    cached = CachedChatModel(llm, model="m", temperature=0.0, mode="default", cache=cache)
+    item = _items(1)[0]
+    cached.store(item["prompt"], _SINGLE)
+    dispatcher = EvaluationDispatcher(cached, max_batch=4, max_wait_ms=10)
+
+    fut = asyncio.run(dispatcher.asubmit(item))
+
+    assert fut.done() and fut.result() == _SINGLE
+    assert dispatcher.stats()["items"] == 0
+    assert llm.prompts == []
@@ -0,0 +1,69 @@
+# tests/test_local_extractor.py
+
+from resume.local_extractor import CONFIDENCE_THRESHOLD, extract_keywords_local, extract_sections_local
+
+
+ENGLISH_SUMMARY = (
+    "I am a backend engineer with 5 years of experience. Led the migration of a payments platform. "
+    "Built Kafka pipelines on the platform, using Python and Docker. Deployed Node.js services on Kubernetes."
+)
+
+KOREAN_SUMMARY = (
+    "지원자는 12개월간 Spring Boot 기반 주문 시스템을 개발했습니다. Redis 캐시 설계 경험을 보유하고 있으며 "
+    "3년간 AWS 인프라를 운영했습니다. 주문 시스템 성능 개선으로 응답 시간을 40% 줄였습니다. "
+    "MySQL 쿼리 튜닝과 주문 시스템 모니터링을 담당했습니다."
+)
+
+
+def test_keywords_strip_trailing_punctuation():
+    keywords, _ = extract_keywords_local(ENGLISH_SUMMARY)
+    assert "platform" in keywords
+    assert not any(k.endswith((".", ",")) for k in keywords)
+    # 안쪽 점은 표기의 일부로 유지
+    assert "Node.js" in keywords
+
+
+def test_keywords_drop_english_function_words():
+    keywords, _ = extract_keywords_local(ENGLISH_SUMMARY)
+    lowered = {k.lower() for k in keywords}
+    assert not lowered & {"am", "of", "led", "the", "a"}
+
+
+def test_keywords_drop_korean_units_and_noise():
+    keywords, confidence = extract_keywords_local(KOREAN_SUMMARY)
+    assert {"Spring", "Redis", "AWS", "MySQL"} <= set(keywords)
+    assert not {"개월간", "년간", "보유", "담당"} & set(keywords)
+    assert confidence >= CONFIDENCE_THRESHOLD
+
+
+def test_keywords_low_confidence_falls_back():
+    # 기술 사전 일치가 없고 용언/불용어뿐인 요약은 LLM으로 넘어가야 함
+    keywords, confidence = extract_keywords_local("저는 열심히 했습니다. 많이 보유하고 있습니다. 12개월간 진행했습니다.")
+    assert confidence < CONFIDENCE_THRESHOLD
+    assert "개월간" not in keywords
+
+
+def test_keywords_empty_summary():
+    assert extract_keywords_local("  ") == ([], 0.0)
+
+
+def test_sections_with_headings():
+    text, confidence = extract_sections_local(
+        "■ 지원 분야\n백엔드 개발\n\n[프로젝트]\n주문 시스템 개발 (응답 시간 40% 단축)\n\n"
+        "기술 스택:\nPython, Docker\n\n자격증\n정보처리기사\n"
+    )
+    assert confidence == 1.0
+    assert confidence >= CONFIDENCE_THRESHOLD
+    assert "=== 직무/관심 ===\n백엔드 개발" in text
+    assert "정보처리기사" in text
+    # 정량 근거가 있으므로 수치 질문은 만들지 않음
+    assert "정량 지표" not in text
+
+
+def test_sections_without_headings_falls_back():
+    text, confidence = extract_sections_local("Python과 Docker로 주문 시스템을 만들었습니다.\nSQLD 취득")
+    assert confidence < CONFIDENCE_THRESHOLD
+    # 제목이 없어도 기술/자격증은 사전 일치로 채움
+    assert "=== 기술/도구 ===\nPython, Docker" in text
+    assert "=== 자격증 ===\nSQLD" in text
+    assert "지원 직무와 관심 분야" in text
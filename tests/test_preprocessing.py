@@ -0,0 +1,78 @@
+# tests/test_preprocessing.py
+
+import asyncio
+
+import pytest
+
+from graph import agent_v2
+from strategy import progressive
+
+
+@pytest.fixture
+def stub_background(monkeypatch):
+    """백그라운드 작업이 실제 LLM을 부르지 않도록 대체."""
+    monkeypatch.setattr(progressive, "extract_sections", lambda text: "=== 기술/도구 ===\nPython")
+    monkeypatch.setattr(progressive, "generate_area_strategy", lambda state, area: {"질문전략": area})
+
+    async def aextract_sections(text):
+        return "=== 기술/도구 ===\nPython"
+
+    async def agenerate_area_strategy(state, area):
+        return {"질문전략": area}
+
+    monkeypatch.setattr(progressive, "aextract_sections", aextract_sections)
+    monkeypatch.setattr(progressive, "agenerate_area_strategy", agenerate_area_strategy)
+    monkeypatch.setattr(agent_v2, "summarize_resume", lambda text: "요약")
+    monkeypatch.setattr(agent_v2, "extract_keywords", lambda summary: ["Python"])
+
+    async def asummarize_resume(text):
+        return "요약"
+
+    async def aextract_keywords(summary):
+        return ["Python"]
+
+    monkeypatch.setattr(agent_v2, "asummarize_resume", asummarize_resume)
+    monkeypatch.setattr(agent_v2, "aextract_keywords", aextract_keywords)
+
+
+def _malformed_strategy(state, area):
+    raise ValueError("전략 파싱 실패")
+
+
+async def _amalformed_strategy(state, area):
+    raise ValueError("전략 파싱 실패")
+
+
+@pytest.mark.parametrize("text", ["", "  \n\n "])
+def test_empty_resume_is_rejected_before_background_work(monkeypatch, stub_background, text):
+    monkeypatch.setattr(agent_v2, "extract_text_from_file", lambda path: text)
+    before = dict(progressive._pending)
+
+    with pytest.raises(ValueError, match="resume_text가 비어 있습니다"):
+        agent_v2.preProcessing_Interview("empty.docx")
+    with pytest.raises(ValueError, match="resume_text가 비어 있습니다"):
+        asyncio.run(agent_v2.apreProcessing_Interview("empty.docx"))
+
+    assert progressive._pending == before
+
+
+def test_failed_foreground_step_discards_background_jobs(monkeypatch, stub_background):
+    monkeypatch.setattr(agent_v2, "extract_text_from_file", lambda path: "이력서 본문")
+    monkeypatch.setattr(agent_v2, "generate_area_strategy", _malformed_strategy)
+    before = dict(progressive._pending)
+
+    with pytest.raises(ValueError, match="전략 파싱 실패"):
+        agent_v2.preProcessing_Interview("resume.docx")
+
+    assert progressive._pending == before
+
+
+def test_failed_foreground_step_discards_background_tasks(monkeypatch, stub_background):
+    monkeypatch.setattr(agent_v2, "extract_text_from_file", lambda path: "이력서 본문")
+    monkeypatch.setattr(agent_v2, "agenerate_area_strategy", _amalformed_strategy)
+    before = dict(progressive._pending)
+
+    with pytest.raises(ValueError, match="전략 파싱 실패"):
+        asyncio.run(agent_v2.apreProcessing_Interview("resume.docx"))
+
+    assert progressive._pending == before
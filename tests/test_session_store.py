@@ -0,0 +1,110 @@
+# tests/test_session_store.py
+
+import asyncio
+import time
+from concurrent.futures import Future
+
+from session.session_store import SessionStore
+from strategy import progressive
+from strategy.strategy_generator import STRATEGY_AREAS
+
+
+def _store(tmp_path) -> SessionStore:
+    return SessionStore(str(tmp_path / "sessions.sqlite"), max_bytes=1 << 20, idle_sec=0.01, expire_sec=3600)
+
+
+def _future(result=None) -> Future:
+    fut = Future()
+    if result is not None:
+        fut.set_result(result)
+    return fut
+
+
+def _uploaded(interview_id: str) -> dict:
+    """업로드 직후 세션: 첫 부문 전략만 있고 나머지는 백그라운드 레지스트리에 있음."""
+    return {"state": {"session_id": interview_id, "question_strategy": {STRATEGY_AREAS[0]: {"질문전략": "첫 부문"}}}}
+
+
+def test_upload_then_idle_session_is_spilled_with_finished_preprocessing(tmp_path):
+    store = _store(tmp_path)
+    jobs = {"resume_sections": _future("=== 기술/도구 ===\nPython")}
+    jobs.update({area: _future({"질문전략": area}) for area in STRATEGY_AREAS[1:]})
+    progressive._pending["iv-done"] = jobs
+
+    session_id = store.create(_uploaded("iv-done"))
+    time.sleep(0.05)
+    store.sweep()
+
+    metrics = store.metrics()
+    assert metrics["spills"] == 1
+    assert metrics["skipped_busy"] == 0
+    assert "iv-done" not in progressive._pending
+
+    state = store.get(session_id)["state"]
+    assert list(state["question_strategy"]) == STRATEGY_AREAS
+    assert state["resume_sections"].startswith("=== 기술/도구 ===")
+
+
+def test_session_with_running_preprocessing_is_kept_until_done(tmp_path):
+    store = _store(tmp_path)
+    running = _future()
+    progressive._pending["iv-running"] = {STRATEGY_AREAS[1]: running}
+
+    store.create(_uploaded("iv-running"))
+    time.sleep(0.05)
+    store.sweep()
+    assert store.metrics()["spills"] == 0
+    assert store.metrics()["skipped_busy"] == 1
+
+    running.set_result({"질문전략": STRATEGY_AREAS[1]})
+    store.sweep()
+    assert store.metrics()["spills"] == 1
+    assert "iv-running" not in progressive._pending
+
+
+def test_failed_preprocessing_is_kept_for_retry_after_rehydration(tmp_path):
+    store = _store(tmp_path)
+    failed = Future()
+    failed.set_exception(RuntimeError("LLM 오류"))
+    progressive._pending["iv-failed"] = {STRATEGY_AREAS[1]: failed}
+
+    session_id = store.create(_uploaded("iv-failed"))
+    time.sleep(0.05)
+    store.sweep()
+
+    assert store.metrics()["spills"] == 1
+    assert "iv-failed" not in progressive._pending
+    assert store.get(session_id)["state"][progressive.RETRY_KEY] == [STRATEGY_AREAS[1]]
+
+
+def test_background_sweeper_spills_idle_sessions_without_requests(tmp_path):
+    store = _store(tmp_path)
+    store.create({"state": {"session_id": "iv-idle"}})
+    store.start_sweeper(interval=0.02)
+    try:
+        deadline = time.time() + 2.0
+        while store.metrics()["spills"] == 0 and time.time() < deadline:
+            time.sleep(0.02)
+    finally:
+        store.stop_sweeper()
+    assert store.metrics()["spills"] == 1
+    assert store.metrics()["resident_sessions"] == 0
+
+
+def test_async_methods_round_trip_through_disk(tmp_path):
+    store = _store(tmp_path)
+
+    async def scenario():
+        session_id = await store.acreate({"state": {"session_id": "iv-async"}, "history": [["🤖", "질문"]]})
+        await asyncio.sleep(0.05)
+        await asyncio.to_thread(store.sweep)
+        data = await store.aget(session_id)
+        data["history"].append(["🙋", "답변"])
+        await store.aput(session_id, data)
+        await store.adelete(session_id)
+        return data, await store.aget(session_id)
+
+    data, deleted = asyncio.run(scenario())
+    assert data["history"][-1] == ["🙋", "답변"]
+    assert deleted is None
+    assert store.metrics()["rehydrations"] == 1
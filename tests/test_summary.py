@@ -0,0 +1,106 @@
+# tests/test_summary.py
+
+import asyncio
+from concurrent.futures import Future
+from types import SimpleNamespace
+
+import pytest
+
+from generation import question_generator, running_summary
+
+DIGEST = "- 답변 요약: 이전 턴\n- 강점: 해당 없음\n- 약점: 근거 부족"
+
+
+class FakeLLM:
+    def __init__(self, text):
+        self.text = text
+        self.prompts = []
+
+    def invoke(self, prompt):
+        self.prompts.append(prompt)
+        return SimpleNamespace(content=self.text)
+
+    async def ainvoke(self, prompt):
+        return self.invoke(prompt)
+
+
+def _state():
+    return {
+        "session_id": "s1",
+        "question_strategy": {"A": {}, "B": {}},
+        "conversation": [
+            {"question": "q1", "answer": "a1", "strategy": "A"},
+            {"question": "q2", "answer": "a2", "strategy": "B"},
+        ],
+        "evaluation": [
+            {"질문과의 연관성": "중", "답변의 구체성": "하", "question_index": 0},
+            {"질문과의 연관성": "상", "답변의 구체성": "중", "question_index": 1},
+        ],
+    }
+
+
+def _done(value):
+    fut = Future()
+    fut.set_result(value)
+    return fut
+
+
+@pytest.fixture
+def registered():
+    # A 섹션(0번 턴)은 요약 완료, 마지막 턴(1번, B 섹션)은 접어 넣지 않은 상태
+    running_summary._sessions["s1"] = {
+        "A": {"base": None, "digest": _done(DIGEST), "turn": 0, "ev": None, "history": [(0, _done(DIGEST))]},
+    }
+    yield
+    running_summary.discard("s1")
+
+
+def test_summary_folds_last_turn_in_one_call(monkeypatch, registered):
+    llm = FakeLLM(
+        "[B]\n- 답변 요약: 마지막 턴\n- 강점: 해당 없음\n- 약점: 없음\n\n"
+        "[종합 피드백]\n- 전체 인상: 양호\n- 핵심 강점: 없음\n- 핵심 보완점: 근거"
+    )
+    monkeypatch.setattr(question_generator, "get_llm", lambda node, state=None: llm)
+    monkeypatch.setattr(question_generator.analytics_sink, "record_interview", lambda state: None)
+
+    report = question_generator.summarize_interview(_state())["summary_report"]
+
+    assert len(llm.prompts) == 1
+    assert "- A: a2" in llm.prompts[0]
+    assert "[A]\n" + DIGEST in report
+    assert "[B]\n- 답변 요약: 마지막 턴" in report
+    assert report.endswith("- 핵심 보완점: 근거")
+
+
+def test_summary_falls_back_on_malformed_reply(monkeypatch, registered):
+    llm = FakeLLM("- 전체 인상: 형식 없음")
+    monkeypatch.setattr(question_generator, "get_llm", lambda node, state=None: llm)
+    monkeypatch.setattr(question_generator.analytics_sink, "record_interview", lambda state: None)
+
+    question_generator.summarize_interview(_state())
+
+    # 두 번째 호출은 전체 Q/A 기반 보고서
+    assert len(llm.prompts) == 2
+    assert "[섹션별 자료]" in llm.prompts[1]
+
+
+def test_fold_survives_cancelled_base(monkeypatch):
+    monkeypatch.setattr(running_summary, "get_llm", lambda node, state=None: FakeLLM(DIGEST))
+    base = Future()
+    base.cancel()
+
+    assert running_summary._fold(base, "A", {"q": "q", "a": "a", "ev": {}}) == DIGEST
+
+
+def test_afold_survives_cancelled_base(monkeypatch):
+    llm = FakeLLM(DIGEST)
+    monkeypatch.setattr(running_summary, "get_llm", lambda node, state=None: llm)
+
+    async def main():
+        base = asyncio.ensure_future(asyncio.sleep(10))
+        base.cancel()
+        return await running_summary._afold(base, "A", {"q": "q", "a": "a", "ev": {}})
+
+    assert asyncio.run(main()) == DIGEST
+    # 선행 요약 없이 이 턴을 접어 넣음
+    assert "(없음)" in llm.prompts[0]